@@ -1,51 +1,123 @@
-import json
+"""
+Content generator agent for LinkedIn Profile Optimizer.
+
+Payloads embedded in LLM prompts are always serialized as compact, sorted-key
+JSON so identical inputs produce byte-identical prompts for prompt caching.
+"""
+
+import asyncio
+import hashlib
 import logging
-import re
 import time
-from typing import Dict, Any, List, Optional
-from langchain_openai import ChatOpenAI
-from langchain.schema import HumanMessage, SystemMessage
+from collections import OrderedDict
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
+import orjson
 
+from utils.json_stream import SectionStreamParser
+from utils.llm_client import build_messages, cache_scope, get_llm, get_openai_client, get_stream_token_usage, get_token_usage
 from utils.prompt_loader import PromptLoader
 from config import config
 
 logger = logging.getLogger(__name__)
 
 
-def extract_json_from_markdown(content: str) -> str:
-    """
-    Extract JSON from markdown code blocks.
+def _dumps(obj: Any) -> str:
+    """Serialize an object to compact, sorted-key JSON for embedding in prompts."""
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+
+
+_loads = orjson.loads
+
+# Exact-match LRU cache of validated content results, stored as JSON bytes so
+# every hit hands the caller a fresh copy
+_RESPONSE_CACHE_SIZE = 256
+_response_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+def _without_token_usage(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop per-call token usage so it doesn't leak into prompts or cache keys."""
+    return {key: value for key, value in data.items() if key != "token_usage"}
+
+
+def _response_cache_key(*parts: str) -> str:
+    """Hash serialized request parts into a stable cache key."""
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=16).hexdigest()
+
+
+CONTENT_CATEGORIES = (
+    "thought_leadership",
+    "industry_insights",
+    "career_achievements",
+    "professional_tips",
+    "team_appreciation",
+    "project_showcase",
+    "learning_journey",
+    "networking_engagement",
+    "company_culture",
+    "industry_trends",
+    "skill_development",
+    "motivational_content"
+)
+
+POST_TYPES = (
+    "text_post",
+    "image_post",
+    "document_carousel",
+    "video_post",
+    "poll",
+    "article",
+    "event_announcement",
+    "job_posting"
+)
+
+
+# Default factories for LLM output validation. List defaults must be fresh per
+# call, so templates containing lists are built by functions rather than shared.
+def _content_defaults() -> Dict[str, Any]:
+    return {"content_strategy": {}, "content_ideas": [], "sample_posts": [], "weekly_content_calendar": []}
 
-    Handles cases where LLM returns JSON wrapped in ```json ... ``` blocks.
 
-    Args:
-        content: Raw LLM response that may contain markdown
+def _strategy_defaults() -> Dict[str, Any]:
+    return {"posting_frequency": "", "best_posting_times": [], "content_pillars": [], "hashtag_strategy": []}
 
-    Returns:
-        Clean JSON string
-    """
-    # Try to extract JSON from markdown code blocks
-    json_pattern = r'```(?:json)?\s*([\s\S]*?)\s*```'
-    match = re.search(json_pattern, content)
 
-    if match:
-        return match.group(1).strip()
+def _idea_defaults() -> Dict[str, Any]:
+    return {"type": "", "topic": "", "objective": "", "target_audience": "", "content": "", "hashtags": [], "call_to_action": ""}
 
-    # If no code block found, return original content (might be raw JSON)
-    return content.strip()
+
+def _sample_post_defaults() -> Dict[str, Any]:
+    return {"title": "", "content": "", "hashtags": [], "engagement_hooks": []}
+
+
+def _single_post_defaults() -> Dict[str, Any]:
+    return {"title": "", "content": "", "hashtags": [], "engagement_hooks": [], "best_posting_time": "", "expected_engagement": ""}
+
+
+_CALENDAR_DEFAULTS = {"day": "", "content_type": "", "topic": "", "brief_description": ""}
+
+
+def _ensure_list(data: Dict[str, Any], key: str) -> list:
+    """Replace a non-list value at `key` with an empty list and return the list."""
+    value = data.get(key)
+    if type(value) is not list:
+        value = data[key] = []
+    return value
 
 
 class ContentGeneratorAgent:
     """Agent responsible for generating LinkedIn content ideas and posts based on profile analysis."""
 
-    def __init__(self, model_name: Optional[str] = None, api_key: Optional[str] = None):
-        self.llm = ChatOpenAI(
-            model=model_name or config.OPENAI_MODEL,
-            temperature=1.0,
-            # max_completion_tokens=config.MAX_TOKENS,
-            openai_api_key=api_key or config.OPENAI_API_KEY
-        )
-        self.prompt_loader = PromptLoader()
+    def __init__(self, model_name: Optional[str] = None, api_key: Optional[str] = None, max_concurrency: int = 32):
+        self.api_key = api_key or config.OPENAI_API_KEY
+        model_name = model_name or config.OPENAI_MODEL
+        self.llm = get_llm(model_name, self.api_key)
+        self._cache_scope = cache_scope(model_name, self.api_key)
+        self.max_concurrency = max_concurrency
+        self.prompt_loader = PromptLoader.get_shared()
+        self._system_prompt = self.prompt_loader.get_system_prompt("content_generator")
+        self._user_prompt_template = self.prompt_loader.get_user_prompt("content_generator")
+        self._post_system_prompt = self.prompt_loader.get_system_prompt("specific_post_generator")
+        self._post_user_prompt_template = self.prompt_loader.get_user_prompt("specific_post_generator")
 
     async def generate_content(self, profile_data: Dict[str, Any], profile_analysis: Dict[str, Any], request_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -60,7 +132,7 @@ class ContentGeneratorAgent:
             Dict[str, Any]: Generated content strategy and sample posts
         """
         req_id = request_id or "unknown"
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         logger.info(f"[INFO] [REQ:{req_id}] Content Generator - Starting content generation...")
 
@@ -73,45 +145,51 @@ class ContentGeneratorAgent:
                 logger.error(f"[ERROR] [REQ:{req_id}] Empty profile analysis provided")
                 raise ValueError("Profile analysis cannot be empty")
 
-            # Get prompts for the agent
-            system_prompt = self.prompt_loader.get_system_prompt("content_generator")
-            user_prompt = self.prompt_loader.format_user_prompt(
-                "content_generator",
-                profile_data=json.dumps(profile_data, indent=2),
-                profile_analysis=json.dumps(profile_analysis, indent=2)
-            )
+            # Serialize each payload once; the same JSON feeds both the cache key and the prompt
+            profile_json = _dumps(_without_token_usage(profile_data))
+            analysis_json = _dumps(_without_token_usage(profile_analysis))
+
+            # Serve identical requests from the response cache
+            cache_key = _response_cache_key(profile_json, analysis_json, self._cache_scope)
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                _response_cache.move_to_end(cache_key)
+                cached_results = _loads(cached)
+                cached_results['token_usage'] = {
+                    'model': self.llm.model_name,
+                    'prompt_tokens': 0,
+                    'completion_tokens': 0,
+                    'total_tokens': 0
+                }
+                total_time = time.perf_counter() - start_time
+                logger.info(f"[CACHE] [REQ:{req_id}] Content generation served from cache in {total_time:.2f}s")
+                return cached_results
 
             # Create messages for the LLM
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ]
+            messages = self._build_content_messages(profile_json, analysis_json)
 
             # Get response from LLM
             logger.info(f"[LLM] [REQ:{req_id}] Sending content generation request to {config.OPENAI_MODEL}...")
-            llm_start = time.time()
+            llm_start = time.perf_counter()
             response = await self.llm.ainvoke(messages)
-            llm_time = time.time() - llm_start
+            llm_time = time.perf_counter() - llm_start
 
             # Extract token usage from response
-            token_usage = {
-                'model': config.OPENAI_MODEL,
-                'prompt_tokens': response.response_metadata.get('token_usage', {}).get('prompt_tokens', 0),
-                'completion_tokens': response.response_metadata.get('token_usage', {}).get('completion_tokens', 0),
-                'total_tokens': response.response_metadata.get('token_usage', {}).get('total_tokens', 0)
-            }
+            token_usage = get_token_usage(response)
 
             logger.info(f"[LLM] [REQ:{req_id}] Content generation response received in {llm_time:.2f}s")
             logger.info(f"[LLM] [REQ:{req_id}] Token usage - Prompt: {token_usage['prompt_tokens']}, Completion: {token_usage['completion_tokens']}, Total: {token_usage['total_tokens']}")
 
             # Parse JSON response
             try:
-                # Extract JSON from markdown if wrapped in code blocks
-                clean_json = extract_json_from_markdown(response.content)
-                content_results = json.loads(clean_json)
+                content_results = _loads(response.content)
                 validated_results = self._validate_content_results(content_results)
 
-                total_time = time.time() - start_time
+                _response_cache[cache_key] = orjson.dumps(validated_results)
+                if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+                    _response_cache.popitem(last=False)
+
+                total_time = time.perf_counter() - start_time
                 content_count = len(validated_results.get('content_ideas', []))
                 posts_count = len(validated_results.get('sample_posts', []))
 
@@ -122,15 +200,77 @@ class ContentGeneratorAgent:
                 validated_results['token_usage'] = token_usage
 
                 return validated_results
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(f"[ERROR] [REQ:{req_id}] JSON parsing failed: {str(e)}")
                 raise ValueError(f"Invalid JSON response from LLM: {str(e)}")
 
         except Exception as e:
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             logger.error(f"[CRITICAL] [REQ:{req_id}] Content generation failed after {total_time:.2f}s: {str(e)}")
             raise Exception(f"Error generating content: {str(e)}")
 
+    async def generate_content_stream(self, profile_data: Dict[str, Any], profile_analysis: Dict[str, Any], request_id: Optional[str] = None) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Stream content generation, yielding each top-level section once it is complete.
+
+        Sections are yielded as (section_name, value) pairs in the order the model
+        emits them, followed by a final ("result", validated_results) pair holding
+        the full validated output with token usage.
+
+        Args:
+            profile_data (Dict[str, Any]): Original profile data
+            profile_analysis (Dict[str, Any]): Analysis results from ProfileAnalyzerAgent
+            request_id (Optional[str]): Request ID for tracking
+
+        Yields:
+            Tuple[str, Any]: Completed section name and its parsed value
+        """
+        req_id = request_id or "unknown"
+        start_time = time.perf_counter()
+
+        logger.info(f"[INFO] [REQ:{req_id}] Content Generator - Starting streamed content generation...")
+
+        try:
+            if not profile_data:
+                raise ValueError("Profile data cannot be empty")
+            if not profile_analysis:
+                raise ValueError("Profile analysis cannot be empty")
+
+            messages = self._build_content_messages(
+                _dumps(_without_token_usage(profile_data)),
+                _dumps(_without_token_usage(profile_analysis))
+            )
+            parser = SectionStreamParser()
+            aggregate = None
+
+            async for chunk in self.llm.astream(messages, stream_usage=True):
+                aggregate = chunk if aggregate is None else aggregate + chunk
+                for section in parser.feed(chunk.content):
+                    yield section
+
+            token_usage = get_stream_token_usage(aggregate)
+
+            validated_results = self._validate_content_results(_loads(parser.text))
+            validated_results['token_usage'] = token_usage
+
+            total_time = time.perf_counter() - start_time
+            logger.info(f"[OK] [REQ:{req_id}] Streamed content generation completed in {total_time:.2f}s")
+
+            yield "result", validated_results
+
+        except Exception as e:
+            total_time = time.perf_counter() - start_time
+            logger.error(f"[CRITICAL] [REQ:{req_id}] Streamed content generation failed after {total_time:.2f}s: {str(e)}")
+            raise Exception(f"Error generating content: {str(e)}")
+
+    def _build_content_messages(self, profile_json: str, analysis_json: str) -> list:
+        """Build the LLM messages for a content generation request from serialized payloads."""
+        user_prompt = self._user_prompt_template.format(
+            profile_data=profile_json,
+            profile_analysis=analysis_json
+        )
+        return build_messages(self._system_prompt, user_prompt)
+
     def _validate_content_results(self, content_results: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate and clean the content generation results.
@@ -142,62 +282,26 @@ class ContentGeneratorAgent:
             Dict[str, Any]: Validated and cleaned content results
         """
         # Ensure required keys exist
-        required_keys = [
-            "content_strategy", "content_ideas", "sample_posts", "weekly_content_calendar"
-        ]
-
-        for key in required_keys:
-            if key not in content_results:
-                content_results[key] = [] if key != "content_strategy" else {}
+        content_results = {**_content_defaults(), **content_results}
 
         # Validate content_strategy structure
-        strategy = content_results.get("content_strategy", {})
-        strategy_keys = ["posting_frequency", "best_posting_times", "content_pillars", "hashtag_strategy"]
-
-        for key in strategy_keys:
-            if key not in strategy:
-                if key in ["best_posting_times", "content_pillars", "hashtag_strategy"]:
-                    strategy[key] = []
-                else:
-                    strategy[key] = ""
-
-        content_results["content_strategy"] = strategy
+        content_results["content_strategy"] = {**_strategy_defaults(), **content_results["content_strategy"]}
 
         # Validate content_ideas structure
-        if not isinstance(content_results["content_ideas"], list):
-            content_results["content_ideas"] = []
-
-        for idea in content_results["content_ideas"]:
-            required_idea_keys = ["type", "topic", "objective", "target_audience", "content", "hashtags", "call_to_action"]
-            for key in required_idea_keys:
-                if key not in idea:
-                    if key == "hashtags":
-                        idea[key] = []
-                    else:
-                        idea[key] = ""
+        content_results["content_ideas"] = [
+            {**_idea_defaults(), **idea} for idea in _ensure_list(content_results, "content_ideas")
+        ]
 
         # Validate sample_posts structure
-        if not isinstance(content_results["sample_posts"], list):
-            content_results["sample_posts"] = []
-
-        for post in content_results["sample_posts"]:
-            required_post_keys = ["title", "content", "hashtags", "engagement_hooks"]
-            for key in required_post_keys:
-                if key not in post:
-                    if key in ["hashtags", "engagement_hooks"]:
-                        post[key] = []
-                    else:
-                        post[key] = ""
+        content_results["sample_posts"] = [
+            {**_sample_post_defaults(), **post} for post in _ensure_list(content_results, "sample_posts")
+        ]
 
         # Validate weekly_content_calendar structure
-        if not isinstance(content_results["weekly_content_calendar"], list):
-            content_results["weekly_content_calendar"] = []
-
-        for calendar_item in content_results["weekly_content_calendar"]:
-            required_calendar_keys = ["day", "content_type", "topic", "brief_description"]
-            for key in required_calendar_keys:
-                if key not in calendar_item:
-                    calendar_item[key] = ""
+        content_results["weekly_content_calendar"] = [
+            {**_CALENDAR_DEFAULTS, **calendar_item}
+            for calendar_item in _ensure_list(content_results, "weekly_content_calendar")
+        ]
 
         return content_results
 
@@ -214,55 +318,153 @@ class ContentGeneratorAgent:
             Dict[str, Any]: Generated post content
         """
         try:
-            # Create a custom prompt for specific post generation
-            custom_prompt = f"""
-            Based on the following LinkedIn profile data, generate a {post_type} post about {topic}.
-
-            Profile Data:
-            {json.dumps(profile_data, indent=2)}
-
-            The post should be:
-            - Professional yet engaging
-            - Authentic to the person's background
-            - Optimized for LinkedIn engagement
-            - Include relevant hashtags
-            - Have a clear call-to-action
-
-            Return the result as JSON with the following structure:
-            {{
-                "title": "string",
-                "content": "string",
-                "hashtags": ["string"],
-                "engagement_hooks": ["string"],
-                "best_posting_time": "string",
-                "expected_engagement": "string"
-            }}
-            """
-
-            # Get system prompt
-            system_prompt = self.prompt_loader.get_system_prompt("content_generator")
+            system_prompt, custom_prompt = self._build_specific_post_prompts(topic, post_type, profile_data)
 
             # Create messages for the LLM
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=custom_prompt)
-            ]
+            messages = build_messages(system_prompt, custom_prompt)
 
             # Get response from LLM
             response = await self.llm.ainvoke(messages)
 
             # Parse JSON response
             try:
-                # Extract JSON from markdown if wrapped in code blocks
-                clean_json = extract_json_from_markdown(response.content)
-                post_data = json.loads(clean_json)
+                post_data = _loads(response.content)
                 return self._validate_single_post(post_data)
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON response from LLM: {str(e)}")
 
         except Exception as e:
             raise Exception(f"Error generating specific post: {str(e)}")
 
+    def _build_specific_post_prompts(self, topic: str, post_type: str, profile_data: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Build the system and user prompts for a specific post.
+
+        Static instructions live in the system prompt; only the dynamic input goes
+        in the user prompt so the shared prefix stays cacheable.
+
+        Returns:
+            Tuple[str, str]: (system_prompt, user_prompt)
+        """
+        user_prompt = self._post_user_prompt_template.format(
+            post_type=post_type,
+            topic=topic,
+            profile_data=_dumps(profile_data)
+        )
+        return self._post_system_prompt, user_prompt
+
+    async def generate_specific_posts(self, requests: List[Tuple[str, str]], profile_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Generate several specific LinkedIn posts concurrently.
+
+        Args:
+            requests (List[Tuple[str, str]]): (topic, post_type) pairs to generate posts for
+            profile_data (Dict[str, Any]): Profile data for context
+
+        Returns:
+            List[Dict[str, Any]]: Generated posts, in the same order as requests
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def generate(topic: str, post_type: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate_specific_post(topic, post_type, profile_data)
+
+        return await asyncio.gather(*(generate(topic, post_type) for topic, post_type in requests))
+
+    async def generate_specific_posts_batch(self, items: List[Dict[str, Any]]) -> str:
+        """
+        Submit specific post generations to the OpenAI Batch API.
+
+        Batches complete within 24 hours at roughly half the cost of online calls,
+        which suits non-realtime work such as pre-generating a content calendar.
+
+        Args:
+            items (List[Dict[str, Any]]): Dicts with "topic", "post_type" and "profile_data" keys
+
+        Returns:
+            str: ID of the submitted batch
+        """
+        try:
+            lines = []
+            for index, item in enumerate(items):
+                system_prompt, user_prompt = self._build_specific_post_prompts(
+                    item["topic"], item["post_type"], item["profile_data"]
+                )
+                lines.append(orjson.dumps({
+                    "custom_id": f"post-{index}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.llm.model_name,
+                        "temperature": config.DEFAULT_TEMPERATURE,
+                        "response_format": {"type": "json_object"},
+                        "messages": [
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": user_prompt}
+                        ]
+                    }
+                }))
+
+            client = get_openai_client(self.api_key)
+            batch_file = await client.files.create(
+                file=("specific_posts.jsonl", b"\n".join(lines)),
+                purpose="batch"
+            )
+            batch = await client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+
+            logger.info(f"[LLM] Submitted batch {batch.id} with {len(items)} post requests")
+            return batch.id
+
+        except Exception as e:
+            raise Exception(f"Error submitting post batch: {str(e)}")
+
+    async def get_specific_posts_batch_results(self, batch_id: str, poll_interval: float = 30.0) -> List[Optional[Dict[str, Any]]]:
+        """
+        Wait for a post batch to finish and return its validated posts.
+
+        Args:
+            batch_id (str): ID returned by generate_specific_posts_batch
+            poll_interval (float): Seconds between batch status checks
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: Posts in submission order, None for failed requests
+        """
+        try:
+            client = get_openai_client(self.api_key)
+
+            batch = await client.batches.retrieve(batch_id)
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(poll_interval)
+                batch = await client.batches.retrieve(batch_id)
+
+            if batch.status != "completed":
+                raise ValueError(f"Batch {batch_id} ended with status: {batch.status}")
+
+            output = await client.files.content(batch.output_file_id)
+            posts: List[Optional[Dict[str, Any]]] = [None] * batch.request_counts.total
+
+            for line in output.content.splitlines():
+                result = _loads(line)
+                index = int(result["custom_id"].split("-", 1)[1])
+                response = result.get("response") or {}
+
+                if result.get("error") or response.get("status_code") != 200:
+                    logger.warning(f"[WARN] Batch {batch_id} request {index} failed: {result.get('error')}")
+                    continue
+
+                content = response["body"]["choices"][0]["message"]["content"]
+                posts[index] = self._validate_single_post(_loads(content))
+
+            return posts
+
+        except Exception as e:
+            raise Exception(f"Error retrieving post batch results: {str(e)}")
+
     def _validate_single_post(self, post_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate a single post data structure.
@@ -273,53 +475,24 @@ class ContentGeneratorAgent:
         Returns:
             Dict[str, Any]: Validated post data
         """
-        required_keys = ["title", "content", "hashtags", "engagement_hooks", "best_posting_time", "expected_engagement"]
-
-        for key in required_keys:
-            if key not in post_data:
-                if key in ["hashtags", "engagement_hooks"]:
-                    post_data[key] = []
-                else:
-                    post_data[key] = ""
+        post_data = {**_single_post_defaults(), **post_data}
 
         return post_data
 
-    def get_content_categories(self) -> List[str]:
+    def get_content_categories(self) -> Tuple[str, ...]:
         """
         Get available content categories for LinkedIn posts.
 
         Returns:
-            List[str]: List of content categories
+            Tuple[str, ...]: Content categories
         """
-        return [
-            "thought_leadership",
-            "industry_insights",
-            "career_achievements",
-            "professional_tips",
-            "team_appreciation",
-            "project_showcase",
-            "learning_journey",
-            "networking_engagement",
-            "company_culture",
-            "industry_trends",
-            "skill_development",
-            "motivational_content"
-        ]
+        return CONTENT_CATEGORIES
 
-    def get_post_types(self) -> List[str]:
+    def get_post_types(self) -> Tuple[str, ...]:
         """
         Get available post types for LinkedIn content.
 
         Returns:
-            List[str]: List of post types
+            Tuple[str, ...]: Post types
         """
-        return [
-            "text_post",
-            "image_post",
-            "document_carousel",
-            "video_post",
-            "poll",
-            "article",
-            "event_announcement",
-            "job_posting"
-        ]
\ No newline at end of file
+        return POST_TYPES
@@ -1,53 +1,60 @@
-import json
 import logging
-import re
 import time
+from functools import cache
 from typing import Dict, Any, Optional, List
-from langchain_openai import ChatOpenAI
-from langchain.schema import HumanMessage, SystemMessage
+import msgspec
+import orjson
 
+from utils.llm_client import build_messages, get_llm, get_token_usage
 from utils.prompt_loader import PromptLoader
 from config import config
 
 logger = logging.getLogger(__name__)
 
-
-def extract_json_from_markdown(content: str) -> str:
-    """
-    Extract JSON from markdown code blocks.
-
-    Handles cases where LLM returns JSON wrapped in ```json ... ``` blocks.
-
-    Args:
-        content: Raw LLM response that may contain markdown
-
-    Returns:
-        Clean JSON string
-    """
-    # Try to extract JSON from markdown code blocks
-    json_pattern = r'```(?:json)?\s*([\s\S]*?)\s*```'
-    match = re.search(json_pattern, content)
-
-    if match:
-        return match.group(1).strip()
-
-    # If no code block found, return original content (might be raw JSON)
-    return content.strip()
+# Expected analysis schema, used to validate LLM output
+_REQUIRED_KEYS = (
+    "overall_score", "strengths", "areas_for_improvement",
+    "recommendations", "industry_insights", "next_steps"
+)
+_REQUIRED_KEY_SET = frozenset(_REQUIRED_KEYS)
+_RECOMMENDATION_LIST_KEYS = (
+    "experience_optimization", "skills_to_add", "skills_to_emphasize",
+    "keywords_to_include", "certifications_to_pursue"
+)
+
+# Profile sections and their weight in the completeness score
+_SECTION_WEIGHTS = (
+    ("personal_info", 20),
+    ("summary", 15),
+    ("experience", 20),
+    ("education", 10),
+    ("skills", 10),
+    ("certifications", 5),
+    ("recommendations", 10),
+    ("languages", 5),
+    ("volunteer_experience", 3),
+    ("publications_projects", 2)
+)
+_MAX_SCORE = sum(weight for _, weight in _SECTION_WEIGHTS)
+
+
+@cache
+def format_recommendation(section: str) -> str:
+    """Return the completeness recommendation for a missing profile section."""
+    return f"Complete the {section} section to improve your profile"
 
 
 class ProfileAnalyzerAgent:
     """Agent responsible for analyzing LinkedIn profile data and providing optimization recommendations."""
 
     def __init__(self, model_name: Optional[str] = None, api_key: Optional[str] = None):
-        self.llm = ChatOpenAI(
-            model=model_name or config.OPENAI_MODEL,
-            temperature=1.0,
-            # max_completion_tokens=config.MAX_TOKENS,
-            openai_api_key=api_key or config.OPENAI_API_KEY
-        )
-        self.prompt_loader = PromptLoader()
-
-    async def analyze_profile(self, profile_data: Dict[str, Any], target_role: Optional[str] = None, request_id: Optional[str] = None) -> Dict[str, Any]:
+        self.llm = get_llm(model_name or config.OPENAI_MODEL, api_key or config.OPENAI_API_KEY)
+        self.prompt_loader = PromptLoader.get_shared()
+        self._system_prompt = self.prompt_loader.get_system_prompt("profile_analyzer")
+        self._user_prompt_template = self.prompt_loader.get_user_prompt("profile_analyzer")
+
+    async def analyze_profile(self, profile_data: Dict[str, Any], target_role: Optional[str] = None, request_id: Optional[str] = None,
+                              profile_json: Optional[str] = None, pdf_content: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze LinkedIn profile data and provide optimization recommendations.
 
@@ -55,79 +62,133 @@ class ProfileAnalyzerAgent:
             profile_data (Dict[str, Any]): Extracted profile data from ProfileCollectorAgent
             target_role (Optional[str]): Target industry/role for optimization
             request_id (Optional[str]): Request ID for tracking
+            profile_json (Optional[str]): Pre-serialized profile_data, to reuse across multiple analyses
+            pdf_content (Optional[str]): Raw profile PDF text, analyzed directly when profile_data is not available yet
 
         Returns:
             Dict[str, Any]: Analysis results with recommendations
         """
         req_id = request_id or "unknown"
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        logger.info(f"[INFO] [REQ:{req_id}] Profile Analyzer - Starting analysis for target role: {target_role or 'General'}")
+        logger.info("[INFO] [REQ:%s] Profile Analyzer - Starting analysis for target role: %s", req_id, target_role or 'General')
 
         try:
             # Validate input data
-            if not profile_data:
-                logger.error(f"[ERROR] [REQ:{req_id}] Empty profile data provided")
+            if not profile_data and not pdf_content:
+                logger.error("[ERROR] [REQ:%s] Empty profile data provided", req_id)
                 raise ValueError("Profile data cannot be empty")
 
             # Get prompts for the agent
-            system_prompt = self.prompt_loader.get_system_prompt("profile_analyzer")
-            user_prompt = self.prompt_loader.format_user_prompt(
-                "profile_analyzer",
-                profile_data=json.dumps(profile_data, indent=2),
+            system_prompt = self._system_prompt
+            user_prompt = self._user_prompt_template.format(
+                profile_data=profile_json or pdf_content or orjson.dumps(profile_data).decode(),
                 target_role=target_role or "General professional development"
             )
 
             # Create messages for the LLM
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ]
+            messages = build_messages(system_prompt, user_prompt)
 
             # Get response from LLM
-            logger.info(f"[LLM] [REQ:{req_id}] Sending analysis request to {config.OPENAI_MODEL}...")
-            llm_start = time.time()
+            logger.info("[LLM] [REQ:%s] Sending analysis request to %s...", req_id, config.OPENAI_MODEL)
+            llm_start = time.perf_counter()
             response = await self.llm.ainvoke(messages)
-            llm_time = time.time() - llm_start
+            llm_time = time.perf_counter() - llm_start
 
             # Extract token usage from response
-            token_usage = {
-                'model': config.OPENAI_MODEL,
-                'prompt_tokens': response.response_metadata.get('token_usage', {}).get('prompt_tokens', 0),
-                'completion_tokens': response.response_metadata.get('token_usage', {}).get('completion_tokens', 0),
-                'total_tokens': response.response_metadata.get('token_usage', {}).get('total_tokens', 0)
-            }
+            token_usage = get_token_usage(response)
 
-            logger.info(f"[LLM] [REQ:{req_id}] Analysis response received in {llm_time:.2f}s")
-            logger.info(f"[LLM] [REQ:{req_id}] Token usage - Prompt: {token_usage['prompt_tokens']}, Completion: {token_usage['completion_tokens']}, Total: {token_usage['total_tokens']}")
+            logger.info("[LLM] [REQ:%s] Analysis response received in %.2fs", req_id, llm_time)
+            logger.info("[LLM] [REQ:%s] Token usage - Prompt: %s, Completion: %s, Total: %s", req_id, token_usage['prompt_tokens'], token_usage['completion_tokens'], token_usage['total_tokens'])
 
             # Parse JSON response
             try:
-                # Extract JSON from markdown if wrapped in code blocks
-                clean_json = extract_json_from_markdown(response.content)
-                logger.info(f"[DEBUG] [REQ:{req_id}] Raw LLM response (first 500 chars): {response.content[:500]}")
-                logger.info(f"[DEBUG] [REQ:{req_id}] Cleaned JSON (first 500 chars): {clean_json[:500]}")
-                analysis_results = json.loads(clean_json)
-                logger.info(f"[DEBUG] [REQ:{req_id}] Parsed overall_score type: {type(analysis_results.get('overall_score'))} value: {analysis_results.get('overall_score')}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[DEBUG] [REQ:%s] Raw LLM response (first 500 chars): %s", req_id, response.content[:500])
+                analysis_results = msgspec.json.decode(response.content)
+                if logger.isEnabledFor(logging.DEBUG):
+                    score = analysis_results.get('overall_score')
+                    logger.debug("[DEBUG] [REQ:%s] Parsed overall_score type: %s value: %s", req_id, type(score), score)
                 validated_results = self._validate_analysis_results(analysis_results)
 
-                total_time = time.time() - start_time
-                logger.info(f"[OK] [REQ:{req_id}] Profile analysis completed in {total_time:.2f}s")
-                logger.info(f"[INFO] [REQ:{req_id}] Analysis score: {validated_results.get('overall_score', 'N/A')}/100")
+                total_time = time.perf_counter() - start_time
+                logger.info("[OK] [REQ:%s] Profile analysis completed in %.2fs", req_id, total_time)
+                logger.info("[INFO] [REQ:%s] Analysis score: %s/100", req_id, validated_results.get('overall_score', 'N/A'))
 
                 # Add token usage to results
                 validated_results['token_usage'] = token_usage
 
                 return validated_results
-            except json.JSONDecodeError as e:
-                logger.error(f"[ERROR] [REQ:{req_id}] JSON parsing failed: {str(e)}")
+            except msgspec.DecodeError as e:
+                logger.error("[ERROR] [REQ:%s] JSON parsing failed: %s", req_id, e)
                 raise ValueError(f"Invalid JSON response from LLM: {str(e)}")
 
         except Exception as e:
-            total_time = time.time() - start_time
-            logger.error(f"[CRITICAL] [REQ:{req_id}] Profile analysis failed after {total_time:.2f}s: {str(e)}")
+            total_time = time.perf_counter() - start_time
+            logger.error("[CRITICAL] [REQ:%s] Profile analysis failed after %.2fs: %s", req_id, total_time, e)
             raise Exception(f"Error analyzing profile: {str(e)}")
 
+    async def analyze_profiles(self, profiles: List[Dict[str, Any]], target_roles: List[Optional[str]],
+                               max_concurrency: int = 10) -> List[Dict[str, Any]]:
+        """
+        Analyze several LinkedIn profiles concurrently in a single batch.
+
+        A profile whose analysis fails does not fail the batch: its entry holds only an
+        'error' message, and the other profiles keep their results.
+
+        Args:
+            profiles (List[Dict[str, Any]]): Extracted profile data, one entry per profile
+            target_roles (List[Optional[str]]): Target industry/role for each profile
+            max_concurrency (int): Maximum number of LLM requests in flight at once
+
+        Returns:
+            List[Dict[str, Any]]: Analysis results or error entries, in the same order as profiles
+
+        Raises:
+            ValueError: If profiles and target_roles differ in length
+        """
+        if len(profiles) != len(target_roles):
+            raise ValueError(f"Expected one target role per profile, got {len(profiles)} profiles and {len(target_roles)} target roles")
+
+        start_time = time.perf_counter()
+
+        logger.info("[INFO] Profile Analyzer - Starting batch analysis of %s profiles", len(profiles))
+
+        try:
+            messages_list = [
+                build_messages(self._system_prompt, self._user_prompt_template.format(
+                    profile_data=orjson.dumps(profile_data).decode(),
+                    target_role=target_role or "General professional development"
+                ))
+                for profile_data, target_role in zip(profiles, target_roles)
+            ]
+
+            responses = await self.llm.abatch(messages_list, config={"max_concurrency": max_concurrency}, return_exceptions=True)
+
+            results = []
+            failed = 0
+            for index, response in enumerate(responses):
+                try:
+                    if isinstance(response, Exception):
+                        raise response
+                    validated_results = self._validate_analysis_results(msgspec.json.decode(response.content))
+                    validated_results['token_usage'] = get_token_usage(response)
+                except Exception as e:
+                    failed += 1
+                    logger.error("[ERROR] Batch analysis of profile %s failed: %s", index, e)
+                    validated_results = {'error': f"Error analyzing profile: {str(e)}"}
+                results.append(validated_results)
+
+            total_time = time.perf_counter() - start_time
+            logger.info("[OK] Batch analysis of %s profiles completed in %.2fs (%s failed)", len(profiles), total_time, failed)
+
+            return results
+
+        except Exception as e:
+            total_time = time.perf_counter() - start_time
+            logger.error("[CRITICAL] Batch profile analysis failed after %.2fs: %s", total_time, e)
+            raise Exception(f"Error analyzing profiles: {str(e)}")
+
     def _validate_analysis_results(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate and clean the analysis results.
@@ -138,75 +199,56 @@ class ProfileAnalyzerAgent:
         Returns:
             Dict[str, Any]: Validated and cleaned analysis results
         """
+        # Fast path: responses that already match the schema need no patching
+        score = analysis_results.get("overall_score")
+        recommendations = analysis_results.get("recommendations")
+        if (
+            _REQUIRED_KEY_SET.issubset(analysis_results)
+            and type(score) is int and 0 <= score <= 100
+            and type(recommendations) is dict
+            and "headline" in recommendations and "summary" in recommendations
+            and all(type(recommendations.get(key)) is list for key in _RECOMMENDATION_LIST_KEYS)
+        ):
+            return analysis_results
+
         # Ensure required keys exist
-        required_keys = [
-            "overall_score", "strengths", "areas_for_improvement",
-            "recommendations", "industry_insights", "next_steps"
-        ]
-
-        for key in required_keys:
-            if key not in analysis_results:
-                if key in ["strengths", "areas_for_improvement", "next_steps"]:
-                    analysis_results[key] = []
-                elif key == "overall_score":
-                    analysis_results[key] = 0
-                elif key == "recommendations":
-                    analysis_results[key] = {}
-                else:
-                    analysis_results[key] = ""
+        analysis_results.setdefault("overall_score", 0)
+        analysis_results.setdefault("strengths", [])
+        analysis_results.setdefault("areas_for_improvement", [])
+        analysis_results.setdefault("recommendations", {})
+        analysis_results.setdefault("industry_insights", "")
+        analysis_results.setdefault("next_steps", [])
 
         # Validate overall_score range
-        score = analysis_results.get("overall_score")
+        score = analysis_results["overall_score"]
 
         # Try to convert string to number if needed
-        if isinstance(score, str):
+        if type(score) is str:
             try:
                 score = float(score)
-            except (ValueError, TypeError):
-                logger.warning(f"Could not convert overall_score string '{score}' to number, defaulting to 0")
+            except ValueError:
+                logger.warning("Could not convert overall_score string '%s' to number, defaulting to 0", score)
                 score = 0
 
-        # Ensure it's a number
-        if not isinstance(score, (int, float)):
-            logger.warning(f"overall_score is not a number (type: {type(score)}), defaulting to 0")
-            analysis_results["overall_score"] = 0
-        else:
-            # Clamp to valid range
+        # Ensure it's a number, clamped to the valid range
+        if type(score) is int or type(score) is float:
             analysis_results["overall_score"] = int(max(0, min(100, score)))
+        else:
+            logger.warning("overall_score is not a number (type: %s), defaulting to 0", type(score))
+            analysis_results["overall_score"] = 0
 
         # Ensure recommendations structure
-        recommendations = analysis_results.get("recommendations", {})
-
-        # Validate headline recommendation
-        if "headline" not in recommendations:
-            recommendations["headline"] = {
-                "current": "",
-                "suggested": "",
-                "reasoning": ""
-            }
-
-        # Validate summary recommendation
-        if "summary" not in recommendations:
-            recommendations["summary"] = {
-                "current": "",
-                "suggested": "",
-                "reasoning": ""
-            }
-
-        # Validate experience optimization
-        if "experience_optimization" not in recommendations:
-            recommendations["experience_optimization"] = []
-        elif not isinstance(recommendations["experience_optimization"], list):
-            recommendations["experience_optimization"] = []
-
-        # Validate skills recommendations
-        for skill_key in ["skills_to_add", "skills_to_emphasize", "keywords_to_include", "certifications_to_pursue"]:
-            if skill_key not in recommendations:
-                recommendations[skill_key] = []
-            elif not isinstance(recommendations[skill_key], list):
-                recommendations[skill_key] = []
-
-        analysis_results["recommendations"] = recommendations
+        recommendations = analysis_results["recommendations"]
+        if type(recommendations) is not dict:
+            recommendations = analysis_results["recommendations"] = {}
+
+        recommendations.setdefault("headline", {"current": "", "suggested": "", "reasoning": ""})
+        recommendations.setdefault("summary", {"current": "", "suggested": "", "reasoning": ""})
+
+        # Validate experience optimization and skills recommendations
+        for key in _RECOMMENDATION_LIST_KEYS:
+            if type(recommendations.get(key)) is not list:
+                recommendations[key] = []
 
         return analysis_results
 
@@ -236,32 +278,17 @@ class ProfileAnalyzerAgent:
             Dict[str, Any]: Completeness analysis
         """
         completeness_score = 0
-        max_score = 100
-        sections = {
-            "personal_info": 20,
-            "summary": 15,
-            "experience": 20,
-            "education": 10,
-            "skills": 10,
-            "certifications": 5,
-            "recommendations": 10,
-            "languages": 5,
-            "volunteer_experience": 3,
-            "publications_projects": 2
-        }
-
         completed_sections = []
         missing_sections = []
 
-        for section, weight in sections.items():
+        for section, weight in _SECTION_WEIGHTS:
             data = profile_data.get(section)
             is_complete = False
 
             if section == "personal_info":
                 # Check if critical personal info fields are filled
                 if data and isinstance(data, dict):
-                    critical_fields = ["name", "title"]
-                    is_complete = all(data.get(field) for field in critical_fields)
+                    is_complete = bool(data.get("name") and data.get("title"))
             elif section == "summary":
                 is_complete = bool(data and data.strip())
             else:
@@ -276,10 +303,8 @@ class ProfileAnalyzerAgent:
 
         return {
             "completeness_score": completeness_score,
+            "max_score": _MAX_SCORE,
             "completed_sections": completed_sections,
             "missing_sections": missing_sections,
-            "recommendations": [
-                f"Complete the {section} section to improve your profile"
-                for section in missing_sections
-            ]
+            "recommendations": [format_recommendation(section) for section in missing_sections]
         }
\ No newline at end of file
@@ -1,53 +1,66 @@
-import json
+import asyncio
+import hashlib
 import logging
-import re
 import time
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
-from langchain.schema import HumanMessage, SystemMessage
-
-from utils.pdf_parser import PDFParser
+from collections import OrderedDict
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Any, Optional
+import msgspec
+import orjson
+
+# PyMuPDF is imported lazily, only once a PDF actually needs parsing
+if TYPE_CHECKING:
+    from utils.pdf_parser import PDFParser
+
+from utils.json_stream import SectionStreamParser
+from utils.llm_client import build_messages, cache_scope, get_llm, get_stream_token_usage
 from utils.prompt_loader import PromptLoader
 from config import config
 
 logger = logging.getLogger(__name__)
 
+# Expected profile schema, used to validate LLM extraction output
+_LIST_KEYS = (
+    "experience", "education", "skills", "certifications",
+    "recommendations", "endorsements", "languages",
+    "volunteer_experience", "publications_projects"
+)
+_REQUIRED_KEYS = ("personal_info", "summary") + _LIST_KEYS
+_PERSONAL_INFO_KEYS = ("name", "title", "location", "email", "phone", "linkedin_url")
+_REQUIRED_KEY_SET = frozenset(_REQUIRED_KEYS)
+_PERSONAL_INFO_KEY_SET = frozenset(_PERSONAL_INFO_KEYS)
 
-def extract_json_from_markdown(content: str) -> str:
-    """
-    Extract JSON from markdown code blocks.
-
-    Handles cases where LLM returns JSON wrapped in ```json ... ``` blocks.
-
-    Args:
-        content: Raw LLM response that may contain markdown
+# Exact-match LRU cache of validated profile data keyed by the PDF text (scoped per
+# model and API key, like every cache of LLM output), so a
+# resubmitted profile (e.g. with a different target role) skips re-extraction;
+# stored as JSON bytes so every hit hands the caller a fresh copy
+_PROFILE_CACHE_SIZE = 32
+_profile_cache: "OrderedDict[str, bytes]" = OrderedDict()
 
-    Returns:
-        Clean JSON string
-    """
-    # Try to extract JSON from markdown code blocks
-    json_pattern = r'```(?:json)?\s*([\s\S]*?)\s*```'
-    match = re.search(json_pattern, content)
 
-    if match:
-        return match.group(1).strip()
-
-    # If no code block found, return original content (might be raw JSON)
-    return content.strip()
+def _profile_cache_key(pdf_content: str, scope: str) -> str:
+    """Hash the PDF text and the model/API key scope into a stable cache key."""
+    return hashlib.blake2b(f"{scope}\0{pdf_content}".encode(), digest_size=16).hexdigest()
 
 
 class ProfileCollectorAgent:
     """Agent responsible for extracting LinkedIn profile information from PDF files."""
 
     def __init__(self, model_name: Optional[str] = None, api_key: Optional[str] = None):
-        self.llm = ChatOpenAI(
-            model=model_name or config.OPENAI_MODEL,
-            temperature=1.0,
-            # max_completion_tokens=config.MAX_TOKENS,
-            openai_api_key=api_key or config.OPENAI_API_KEY
-        )
-        self.pdf_parser = PDFParser()
-        self.prompt_loader = PromptLoader()
+        model_name = model_name or config.OPENAI_MODEL
+        api_key = api_key or config.OPENAI_API_KEY
+        self.llm = get_llm(model_name, api_key)
+        self._cache_scope = cache_scope(model_name, api_key)
+        self.prompt_loader = PromptLoader.get_shared()
+        self._system_prompt = self.prompt_loader.get_system_prompt("profile_collector")
+        self._user_prompt_template = self.prompt_loader.get_user_prompt("profile_collector")
+
+    @cached_property
+    def pdf_parser(self) -> "PDFParser":
+        """PDF parser, created on first use."""
+        from utils.pdf_parser import PDFParser
+
+        return PDFParser()
 
     async def extract_profile_data(self, pdf_path: str) -> Dict[str, Any]:
         """
@@ -60,41 +73,36 @@ class ProfileCollectorAgent:
             Dict[str, Any]: Extracted profile data in structured format
         """
         try:
+            # PyMuPDF parsing blocks, so it runs in a worker thread off the event loop
             # Validate PDF file
-            if not self.pdf_parser.validate_pdf(pdf_path):
+            if not await asyncio.to_thread(self.pdf_parser.validate_pdf, pdf_path):
                 raise ValueError("Invalid PDF file")
 
             # Extract text content from PDF
-            pdf_content = self.pdf_parser.extract_text_from_pdf(pdf_path)
+            pdf_content = await asyncio.to_thread(self.pdf_parser.extract_text_from_pdf, pdf_path)
 
             if not pdf_content.strip():
                 raise ValueError("No text content found in PDF")
 
             # Get prompts for the agent
-            system_prompt = self.prompt_loader.get_system_prompt("profile_collector")
-            user_prompt = self.prompt_loader.format_user_prompt(
-                "profile_collector",
+            system_prompt = self._system_prompt
+            user_prompt = self._user_prompt_template.format(
                 pdf_content=pdf_content
             )
 
             # Create messages for the LLM
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ]
+            messages = build_messages(system_prompt, user_prompt)
 
             # Get response from LLM
             response = await self.llm.ainvoke(messages)
 
             # Parse JSON response
             try:
-                # Extract JSON from markdown if wrapped in code blocks
-                clean_json = extract_json_from_markdown(response.content)
-                profile_data = json.loads(clean_json)
+                profile_data = msgspec.json.decode(response.content)
                 return self._validate_profile_data(profile_data)
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON parsing failed: {str(e)}")
-                logger.error(f"LLM response content: {response.content[:500]}...")
+            except msgspec.DecodeError as e:
+                logger.error("JSON parsing failed: %s", e)
+                logger.error("LLM response content: %s...", response.content[:500])
                 raise ValueError(f"Invalid JSON response from LLM: {str(e)}")
 
         except Exception as e:
@@ -112,88 +120,162 @@ class ProfileCollectorAgent:
             Dict[str, Any]: Extracted profile data in structured format
         """
         req_id = request_id or "unknown"
-        step_start = time.time()
-
-        logger.info(f"[INFO] [REQ:{req_id}] Profile Collector - Starting PDF text extraction...")
 
         try:
-            # Extract text content from PDF bytes
-            extraction_start = time.time()
-            pdf_content = self.pdf_parser.extract_text_from_bytes(pdf_bytes, req_id)
-            extraction_time = time.time() - extraction_start
+            # PyMuPDF parsing blocks, so it runs in a worker thread off the event loop
+            pdf_content = await asyncio.to_thread(self.extract_text_from_bytes, pdf_bytes, req_id)
+        except Exception as e:
+            raise Exception(f"Error extracting profile data from bytes: {str(e)}")
 
-            logger.info(f"[INFO] [REQ:{req_id}] PDF text extracted in {extraction_time:.2f}s ({len(pdf_content)} characters)")
+        return await self.extract_profile_data_from_text(pdf_content, req_id)
 
-            if not pdf_content.strip():
-                logger.error(f"[ERROR] [REQ:{req_id}] No text content found in PDF")
-                raise ValueError("No text content found in PDF")
+    def extract_text_from_bytes(self, pdf_bytes: bytes, request_id: Optional[str] = None) -> str:
+        """
+        Extract the raw text content from PDF bytes.
 
-            # Get prompts for the agent
-            logger.info(f"[INFO] [REQ:{req_id}] Loading system and user prompts...")
-            system_prompt = self.prompt_loader.get_system_prompt("profile_collector")
-            user_prompt = self.prompt_loader.format_user_prompt(
-                "profile_collector",
-                pdf_content=pdf_content
-            )
+        Args:
+            pdf_bytes (bytes): PDF content as bytes
+            request_id (Optional[str]): Request ID for tracking
 
-            # Create messages for the LLM
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ]
+        Returns:
+            str: Extracted text content
+        """
+        req_id = request_id or "unknown"
 
-            logger.info(f"[LLM] [REQ:{req_id}] Sending profile data to {config.OPENAI_MODEL} for extraction...")
-            llm_start = time.time()
+        logger.info("[INFO] [REQ:%s] Profile Collector - Starting PDF text extraction...", req_id)
 
-            # Get response from LLM
-            response = await self.llm.ainvoke(messages)
-            llm_time = time.time() - llm_start
+        extraction_start = time.perf_counter()
+        pdf_content = self.pdf_parser.extract_text_from_bytes(pdf_bytes, req_id)
+        extraction_time = time.perf_counter() - extraction_start
 
-            # Extract token usage from response
-            token_usage = {
-                'model': config.OPENAI_MODEL,
-                'prompt_tokens': response.response_metadata.get('token_usage', {}).get('prompt_tokens', 0),
-                'completion_tokens': response.response_metadata.get('token_usage', {}).get('completion_tokens', 0),
-                'total_tokens': response.response_metadata.get('token_usage', {}).get('total_tokens', 0)
+        logger.info("[INFO] [REQ:%s] PDF text extracted in %.2fs (%s characters)", req_id, extraction_time, len(pdf_content))
+
+        if not pdf_content.strip():
+            logger.error("[ERROR] [REQ:%s] No text content found in PDF", req_id)
+            raise ValueError("No text content found in PDF")
+
+        return pdf_content
+
+    def extract_text_from_path(self, pdf_path: str, request_id: Optional[str] = None) -> str:
+        """
+        Extract the raw text content from a PDF file on disk.
+
+        Args:
+            pdf_path (str): Path to the PDF file
+            request_id (Optional[str]): Request ID for tracking
+
+        Returns:
+            str: Extracted text content
+        """
+        req_id = request_id or "unknown"
+
+        logger.info("[INFO] [REQ:%s] Profile Collector - Starting PDF text extraction...", req_id)
+
+        extraction_start = time.perf_counter()
+        pdf_content = self.pdf_parser.extract_text_from_pdf(pdf_path, req_id)
+        extraction_time = time.perf_counter() - extraction_start
+
+        logger.info("[INFO] [REQ:%s] PDF text extracted in %.2fs (%s characters)", req_id, extraction_time, len(pdf_content))
+
+        if not pdf_content.strip():
+            logger.error("[ERROR] [REQ:%s] No text content found in PDF", req_id)
+            raise ValueError("No text content found in PDF")
+
+        return pdf_content
+
+    async def extract_profile_data_from_text(self, pdf_content: str, request_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Extract structured LinkedIn profile data from PDF text content.
+
+        Args:
+            pdf_content (str): Text content extracted from the profile PDF
+            request_id (Optional[str]): Request ID for tracking
+
+        Returns:
+            Dict[str, Any]: Extracted profile data in structured format
+        """
+        req_id = request_id or "unknown"
+        step_start = time.perf_counter()
+
+        # Serve previously extracted profiles from the cache
+        cache_key = _profile_cache_key(pdf_content, self._cache_scope)
+        cached = _profile_cache.get(cache_key)
+        if cached is not None:
+            _profile_cache.move_to_end(cache_key)
+            cached_data = orjson.loads(cached)
+            cached_data['token_usage'] = {
+                'model': self.llm.model_name,
+                'prompt_tokens': 0,
+                'completion_tokens': 0,
+                'total_tokens': 0
             }
+            logger.info("[CACHE] [REQ:%s] Profile data served from cache in %.2fs", req_id, time.perf_counter() - step_start)
+            return cached_data
 
-            logger.info(f"[LLM] [REQ:{req_id}] LLM response received in {llm_time:.2f}s ({len(response.content)} characters)")
-            logger.info(f"[LLM] [REQ:{req_id}] Token usage - Prompt: {token_usage['prompt_tokens']}, Completion: {token_usage['completion_tokens']}, Total: {token_usage['total_tokens']}")
+        try:
+            # Get prompts for the agent
+            logger.info("[INFO] [REQ:%s] Loading system and user prompts...", req_id)
+            system_prompt = self._system_prompt
+            user_prompt = self._user_prompt_template.format(
+                pdf_content=pdf_content
+            )
 
-            # Parse JSON response
+            # Create messages for the LLM
+            messages = build_messages(system_prompt, user_prompt)
+
+            logger.info("[LLM] [REQ:%s] Sending profile data to %s for extraction...", req_id, config.OPENAI_MODEL)
+            llm_start = time.perf_counter()
+            first_token_time = None
+
+            # Stream the response, decoding each top-level section as soon as it completes
+            parser = SectionStreamParser()
+            profile_data = {}
+            aggregate = None
             try:
-                parsing_start = time.time()
+                async for chunk in self.llm.astream(messages, stream_usage=True):
+                    if first_token_time is None:
+                        first_token_time = time.perf_counter() - llm_start
+                    aggregate = chunk if aggregate is None else aggregate + chunk
+                    profile_data.update(parser.feed(chunk.content))
+
+                # Fall back to a full decode if the stream never closed the top-level object
+                if not parser.complete:
+                    profile_data = msgspec.json.decode(parser.text)
+            except (msgspec.DecodeError, orjson.JSONDecodeError) as e:
+                logger.error("[ERROR] [REQ:%s] JSON parsing failed: %s", req_id, e)
+                logger.error("[ERROR] [REQ:%s] LLM response content: %s...", req_id, parser.text[:500])
+                raise ValueError(f"Invalid JSON response from LLM: {str(e)}")
 
-                # Extract JSON from markdown if wrapped in code blocks
-                clean_json = extract_json_from_markdown(response.content)
-                profile_data = json.loads(clean_json)
-                parsing_time = time.time() - parsing_start
+            llm_time = time.perf_counter() - llm_start
 
-                logger.info(f"[INFO] [REQ:{req_id}] JSON parsing completed in {parsing_time:.2f}s")
+            # Extract token usage from response
+            token_usage = get_stream_token_usage(aggregate)
 
-                # Validate and clean data
-                validation_start = time.time()
-                validated_data = self._validate_profile_data(profile_data, req_id)
-                validation_time = time.time() - validation_start
+            logger.info("[LLM] [REQ:%s] LLM response received and parsed in %.2fs (first token after %.2fs, %s characters)", req_id, llm_time, first_token_time or 0, len(parser.text))
+            logger.info("[LLM] [REQ:%s] Token usage - Prompt: %s, Completion: %s, Total: %s", req_id, token_usage['prompt_tokens'], token_usage['completion_tokens'], token_usage['total_tokens'])
 
-                total_time = time.time() - step_start
-                logger.info(f"[OK] [REQ:{req_id}] Profile collection completed in {total_time:.2f}s")
-                logger.info(f"[INFO] [REQ:{req_id}] Breakdown: PDF({extraction_time:.1f}s) + LLM({llm_time:.1f}s) + Parse({parsing_time:.1f}s) + Validate({validation_time:.1f}s)")
+            # Validate and clean data
+            validation_start = time.perf_counter()
+            validated_data = self._validate_profile_data(profile_data, req_id)
+            validation_time = time.perf_counter() - validation_start
 
-                # Add token usage to results
-                validated_data['token_usage'] = token_usage
+            _profile_cache[cache_key] = orjson.dumps(validated_data)
+            if len(_profile_cache) > _PROFILE_CACHE_SIZE:
+                _profile_cache.popitem(last=False)
 
-                return validated_data
+            total_time = time.perf_counter() - step_start
+            logger.info("[OK] [REQ:%s] Profile collection completed in %.2fs", req_id, total_time)
+            logger.info("[INFO] [REQ:%s] Breakdown: LLM+Parse(%.1fs) + Validate(%.1fs)", req_id, llm_time, validation_time)
 
-            except json.JSONDecodeError as e:
-                logger.error(f"[ERROR] [REQ:{req_id}] JSON parsing failed: {str(e)}")
-                logger.error(f"[ERROR] [REQ:{req_id}] LLM response content: {response.content[:500]}...")
-                raise ValueError(f"Invalid JSON response from LLM: {str(e)}")
+            # Add token usage to results
+            validated_data['token_usage'] = token_usage
+
+            return validated_data
 
         except Exception as e:
-            total_time = time.time() - step_start
-            logger.error(f"[CRITICAL] [REQ:{req_id}] Profile collection failed after {total_time:.2f}s: {str(e)}")
-            raise Exception(f"Error extracting profile data from bytes: {str(e)}")
+            total_time = time.perf_counter() - step_start
+            logger.error("[CRITICAL] [REQ:%s] Profile collection failed after %.2fs: %s", req_id, total_time, e)
+            raise Exception(f"Error extracting profile data from text: {str(e)}")
 
     def _validate_profile_data(self, profile_data: Dict[str, Any], request_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -207,39 +289,38 @@ class ProfileCollectorAgent:
             Dict[str, Any]: Validated and cleaned profile data
         """
         req_id = request_id or "unknown"
-        logger.info(f"[INFO] [REQ:{req_id}] Validating extracted profile data...")
-        required_keys = [
-            "personal_info", "summary", "experience", "education",
-            "skills", "certifications", "recommendations", "endorsements",
-            "languages", "volunteer_experience", "publications_projects"
-        ]
-
-        # Ensure all required keys exist
-        for key in required_keys:
-            if key not in profile_data:
-                profile_data[key] = [] if key != "summary" and key != "personal_info" else None
-
-        # Validate personal_info structure
-        if not profile_data.get("personal_info"):
-            profile_data["personal_info"] = {}
-
-        personal_info_keys = ["name", "title", "location", "email", "phone", "linkedin_url"]
-        for key in personal_info_keys:
-            if key not in profile_data["personal_info"]:
-                profile_data["personal_info"][key] = None
-
-        # Ensure lists are actually lists
-        list_keys = ["experience", "education", "skills", "certifications",
-                    "recommendations", "endorsements", "languages",
-                    "volunteer_experience", "publications_projects"]
-
-        for key in list_keys:
-            if not isinstance(profile_data[key], list):
-                profile_data[key] = []
+        logger.info("[INFO] [REQ:%s] Validating extracted profile data...", req_id)
+
+        personal_info = profile_data.get("personal_info")
+        conforms = (
+            _REQUIRED_KEY_SET.issubset(profile_data)
+            and type(personal_info) is dict
+            and _PERSONAL_INFO_KEY_SET.issubset(personal_info)
+            and all(type(profile_data[key]) is list for key in _LIST_KEYS)
+        )
+
+        # Only patch the data when it doesn't already match the expected schema
+        if not conforms:
+            profile_data.setdefault("personal_info", None)
+            profile_data.setdefault("summary", None)
+
+            # Validate personal_info structure
+            personal_info = profile_data["personal_info"]
+            if type(personal_info) is not dict:
+                personal_info = profile_data["personal_info"] = {}
+
+            for key in _PERSONAL_INFO_KEYS:
+                personal_info.setdefault(key, None)
+
+            # Ensure list sections exist and are actually lists
+            for key in _LIST_KEYS:
+                if type(profile_data.get(key)) is not list:
+                    profile_data[key] = []
 
         # Log validation results
-        filled_sections = sum(1 for key in required_keys if profile_data.get(key))
-        logger.info(f"[OK] [REQ:{req_id}] Profile validation completed: {filled_sections}/{len(required_keys)} sections filled")
+        if logger.isEnabledFor(logging.INFO):
+            filled_sections = sum(1 for key in _REQUIRED_KEYS if profile_data.get(key))
+            logger.info("[OK] [REQ:%s] Profile validation completed: %s/%s sections filled", req_id, filled_sections, len(_REQUIRED_KEYS))
 
         return profile_data
 
@@ -5,53 +5,132 @@ This module handles loading and managing environment variables and application s
 """
 
 import os
+import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
 from typing import Optional
 
 # Load environment variables from .env file
-# Check backend/.env first (local dev), then project root (Docker/production)
-backend_env = Path(__file__).parent / ".env"
-root_env = Path(__file__).parent.parent / ".env"
+# Check backend/.env first (local dev), then project root (Docker/production).
+# Deployments that inject the environment directly can set SKIP_DOTENV=true
+# to skip the file probes and parsing on every worker boot.
+if os.environ.get("SKIP_DOTENV", "false").lower() != "true":
+    from dotenv import load_dotenv
 
-if backend_env.exists():
-    load_dotenv(backend_env)
-elif root_env.exists():
-    load_dotenv(root_env)
+    backend_env = Path(__file__).parent / ".env"
+    root_env = Path(__file__).parent.parent / ".env"
+
+    if backend_env.exists():
+        load_dotenv(backend_env)
+    elif root_env.exists():
+        load_dotenv(root_env)
+
+# Snapshot the environment once, after .env has been applied
+_ENV_SNAPSHOT = os.environ.copy()
+
+
+def _env(key: str, default: str = "") -> str:
+    """Look up a setting in the environment snapshot."""
+    return _ENV_SNAPSHOT.get(key, default)
 
 
 class Config:
-    """Application configuration class."""
+    """
+    Application configuration class.
+
+    Settings are resolved lazily on first access and then cached on the
+    instance, so unused settings never pay for their lookup and conversion.
+    """
+
+    # File Upload Configuration
+    ALLOWED_EXTENSIONS: list = [".pdf"]
 
     # OpenAI Configuration
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o")
+    @cached_property
+    def OPENAI_API_KEY(self) -> str:
+        return _env("OPENAI_API_KEY", "")
+
+    @cached_property
+    def OPENAI_MODEL(self) -> str:
+        return _env("OPENAI_MODEL", "gpt-4o")
 
     # Server Configuration
-    HOST: str = os.getenv("HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("PORT", "8000"))
-    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
+    @cached_property
+    def HOST(self) -> str:
+        return _env("HOST", "0.0.0.0")
+
+    @cached_property
+    def PORT(self) -> int:
+        return int(_env("PORT", "8000"))
+
+    @cached_property
+    def DEBUG(self) -> bool:
+        return _env("DEBUG", "false").lower() == "true"
 
     # File Upload Configuration
-    MAX_FILE_SIZE: int = int(os.getenv("MAX_FILE_SIZE", str(10 * 1024 * 1024)))  # 10MB default
-    ALLOWED_EXTENSIONS: list = [".pdf"]
+    @cached_property
+    def MAX_FILE_SIZE(self) -> int:
+        return int(_env("MAX_FILE_SIZE", str(10 * 1024 * 1024)))  # 10MB default
+
+    @cached_property
+    def MAX_FILE_SIZE_MB(self) -> int:
+        return self.MAX_FILE_SIZE // (1024 * 1024)
+
+    @cached_property
+    def MAX_FILE_SIZE_ERROR(self) -> str:
+        return f"File size exceeds {self.MAX_FILE_SIZE_MB}MB limit"
 
     # LLM Configuration
-    DEFAULT_TEMPERATURE: float = float(os.getenv("DEFAULT_TEMPERATURE", "1"))
-    MAX_TOKENS: int = int(os.getenv("MAX_TOKENS", "4000"))
-    MAX_COMPLETION_TOKENS: int = int(os.getenv("MAX_COMPLETION_TOKENS", "4000"))
+    @cached_property
+    def DEFAULT_TEMPERATURE(self) -> float:
+        return float(_env("DEFAULT_TEMPERATURE", "1"))
+
+    @cached_property
+    def MAX_TOKENS(self) -> int:
+        return int(_env("MAX_TOKENS", "4000"))
+
+    @cached_property
+    def MAX_COMPLETION_TOKENS(self) -> int:
+        return int(_env("MAX_COMPLETION_TOKENS", "4000"))
+
+    # Upper bound on each workflow step's LLM work, so a stalled call fails the step instead of hanging the run
+    @cached_property
+    def STEP_TIMEOUT_SECONDS(self) -> float:
+        return float(_env("STEP_TIMEOUT_SECONDS", "300"))
+
+    # SQLite path for LangChain's LLM response cache (disabled when empty)
+    @cached_property
+    def LLM_CACHE_PATH(self) -> str:
+        return _env("LLM_CACHE_PATH", "")
 
     # CORS Configuration
-    ALLOWED_ORIGINS: list = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
+    @cached_property
+    def ALLOWED_ORIGINS(self) -> list:
+        return _env("ALLOWED_ORIGINS", "http://localhost:3000,https://linkedin-profile-optimizer.otterlab.dev").split(",")
+
+    # Interned origin set for O(1) membership checks in the CORS middleware
+    @cached_property
+    def ALLOWED_ORIGINS_SET(self) -> frozenset:
+        return frozenset(sys.intern(origin.strip()) for origin in self.ALLOWED_ORIGINS if origin.strip())
 
     # AWS Configuration
-    AWS_ACCESS_KEY_ID: str = os.getenv("AWS_ACCESS_KEY_ID", "")
-    AWS_SECRET_ACCESS_KEY: str = os.getenv("AWS_SECRET_ACCESS_KEY", "")
-    AWS_REGION: str = os.getenv("AWS_REGION", "us-east-1")
-    DYNAMODB_TABLE_NAME: str = os.getenv("DYNAMODB_TABLE_NAME", "linkedin-optimization-results")
+    @cached_property
+    def AWS_ACCESS_KEY_ID(self) -> str:
+        return _env("AWS_ACCESS_KEY_ID", "")
+
+    @cached_property
+    def AWS_SECRET_ACCESS_KEY(self) -> str:
+        return _env("AWS_SECRET_ACCESS_KEY", "")
+
+    @cached_property
+    def AWS_REGION(self) -> str:
+        return _env("AWS_REGION", "us-east-1")
+
+    @cached_property
+    def DYNAMODB_TABLE_NAME(self) -> str:
+        return _env("DYNAMODB_TABLE_NAME", "linkedin-optimization-results")
 
-    @classmethod
-    def validate(cls) -> bool:
+    def validate(self) -> bool:
         """
         Validate that all required configuration is present.
 
@@ -59,41 +138,42 @@ class Config:
             bool: True if configuration is valid, False otherwise
         """
         # OPENAI_API_KEY is optional - users can provide their own through the API
-        if not cls.OPENAI_API_KEY:
+        if not self.OPENAI_API_KEY:
             print("⚠️ OPENAI_API_KEY not set - users must provide their own API key")
             return True  # Still valid, just a warning
 
-        if not cls.OPENAI_API_KEY.startswith("sk-"):
+        if not self.OPENAI_API_KEY.startswith("sk-"):
             print("❌ OPENAI_API_KEY appears to be invalid (should start with 'sk-')")
             return False
 
         return True
 
-    @classmethod
-    def print_config(cls) -> None:
+    def print_config(self) -> None:
         """Print current configuration (excluding sensitive data)."""
         print("🔧 Current Configuration:")
-        print(f"   OpenAI Model: {cls.OPENAI_MODEL}")
-        print(f"   Host: {cls.HOST}")
-        print(f"   Port: {cls.PORT}")
-        print(f"   Debug Mode: {cls.DEBUG}")
-        print(f"   Max File Size: {cls.MAX_FILE_SIZE / 1024 / 1024:.1f} MB")
-        print(f"   Default Temperature: {cls.DEFAULT_TEMPERATURE}")
-        print(f"   Max Tokens: {cls.MAX_TOKENS}")
-        print(f"   Allowed Origins: {', '.join(cls.ALLOWED_ORIGINS)}")
+        print(f"   OpenAI Model: {self.OPENAI_MODEL}")
+        print(f"   Host: {self.HOST}")
+        print(f"   Port: {self.PORT}")
+        print(f"   Debug Mode: {self.DEBUG}")
+        print(f"   Max File Size: {self.MAX_FILE_SIZE / 1024 / 1024:.1f} MB")
+        print(f"   Default Temperature: {self.DEFAULT_TEMPERATURE}")
+        print(f"   Max Tokens: {self.MAX_TOKENS}")
+        print(f"   Step Timeout: {self.STEP_TIMEOUT_SECONDS:.0f}s")
+        print(f"   LLM Cache: {self.LLM_CACHE_PATH or 'Disabled'}")
+        print(f"   Allowed Origins: {', '.join(self.ALLOWED_ORIGINS)}")
 
         # Show API key status without revealing the key
-        if cls.OPENAI_API_KEY:
-            masked_key = cls.OPENAI_API_KEY[:8] + "..." + cls.OPENAI_API_KEY[-4:]
+        if self.OPENAI_API_KEY:
+            masked_key = self.OPENAI_API_KEY[:8] + "..." + self.OPENAI_API_KEY[-4:]
             print(f"   OpenAI API Key: {masked_key} ✓")
         else:
             print("   OpenAI API Key: Not set ❌")
 
         # Show AWS configuration status
-        print(f"   AWS Region: {cls.AWS_REGION}")
-        print(f"   DynamoDB Table: {cls.DYNAMODB_TABLE_NAME}")
-        if cls.AWS_ACCESS_KEY_ID and cls.AWS_SECRET_ACCESS_KEY:
-            masked_key_id = cls.AWS_ACCESS_KEY_ID[:4] + "..." + cls.AWS_ACCESS_KEY_ID[-4:] if len(cls.AWS_ACCESS_KEY_ID) > 8 else "***"
+        print(f"   AWS Region: {self.AWS_REGION}")
+        print(f"   DynamoDB Table: {self.DYNAMODB_TABLE_NAME}")
+        if self.AWS_ACCESS_KEY_ID and self.AWS_SECRET_ACCESS_KEY:
+            masked_key_id = self.AWS_ACCESS_KEY_ID[:4] + "..." + self.AWS_ACCESS_KEY_ID[-4:] if len(self.AWS_ACCESS_KEY_ID) > 8 else "***"
             print(f"   AWS Access Key: {masked_key_id} ✓")
         else:
             print("   AWS Credentials: Not set (results won't be saved) ⚠️")
@@ -118,6 +198,7 @@ def is_debug_mode() -> bool:
     return config.DEBUG
 
 
+@lru_cache(maxsize=1)
 def validate_config() -> bool:
-    """Validate the current configuration."""
+    """Validate the current configuration (evaluated once per process, as settings never change after load)."""
     return config.validate()
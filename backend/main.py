@@ -1,14 +1,23 @@
+import asyncio
+import hashlib
 import logging
+import os
+import re
+import secrets
+import sys
+import tempfile
 import time
-import uuid
-from typing import Optional
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from workflows.linkedin_optimizer_workflow import LinkedInOptimizerWorkflow
 from config import config, validate_config
 from utils.dynamodb_storage import storage
+from utils.llm_client import close_llm_clients
 
 # Configure logging
 logging.basicConfig(
@@ -19,24 +28,74 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-# Validate configuration on startup
-if not validate_config():
-    print("[ERROR] Configuration validation failed. Please check your environment variables.")
-    exit(1)
+# Size of each read when spooling an uploaded PDF to disk
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Path prefix through which an unnamed (O_TMPFILE) upload file is reopened by descriptor
+PROC_FD_PREFIX = "/proc/self/fd/"
+
+# Successful results are kept briefly, keyed by a digest of the PDF, target role and
+# API key, so re-uploading the same profile skips the whole LLM pipeline
+RESULT_CACHE_TTL = 3600.0
+RESULT_CACHE_SIZE = 256
+_result_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# Allowance for multipart boundaries and form fields on top of the PDF itself
+UPLOAD_OVERHEAD_BYTES = 64 * 1024
+
+# Workflow steps reported by the progress endpoint, in execution order
+ALL_STEPS = ('optimization_started', 'profile_extraction', 'profile_analysis', 'content_generation', 'optimization_completed')
+ALL_STEPS_COUNT = len(ALL_STEPS)
+# Progress percentage for each number of completed steps
+PROGRESS_PERCENTAGES = tuple(round(count / ALL_STEPS_COUNT * 100, 1) for count in range(ALL_STEPS_COUNT + 1))
+
+# Optimization IDs: 6-50 characters of letters, digits and hyphens (e.g. UUIDs)
+OPTIMIZATION_ID_RE = re.compile(r"[A-Za-z0-9-]{6,50}")
+
+# OpenAI API key shape: 'sk-' prefix, at least 20 characters in total
+API_KEY_RE = re.compile(r"sk-[A-Za-z0-9_-]{17,}")
+
+# Enable LangChain's LLM response cache so identical prompts skip the API call
+if config.LLM_CACHE_PATH:
+    from langchain_core.globals import set_llm_cache
+    from langchain_community.cache import SQLiteCache
+
+    set_llm_cache(SQLiteCache(database_path=config.LLM_CACHE_PATH))
+    logger.info("[CONFIG] LLM response cache enabled at %s", config.LLM_CACHE_PATH)
 
 app = FastAPI(
     title="LinkedIn Profile Optimizer",
     description="Multi-Agent System for optimizing LinkedIn profiles using AI",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+
+@app.middleware("http")
+async def reject_oversized_uploads(request: Request, call_next):
+    """
+    Reject uploads whose declared Content-Length already exceeds the size limit.
+
+    FastAPI parses the whole multipart body before the endpoint runs, so this is
+    the only point where an oversized upload can be refused before it is received.
+    Registered before CORSMiddleware so the rejection still carries CORS headers.
+    """
+    content_length = request.headers.get("content-length")
+    if (
+        request.method == "POST"
+        and content_length is not None
+        and content_length.isdigit()
+        and int(content_length) > config.MAX_FILE_SIZE + UPLOAD_OVERHEAD_BYTES
+    ):
+        logger.warning("[ERROR] Upload rejected before reading: Content-Length %s bytes", content_length)
+        return ORJSONResponse(status_code=413, content={"detail": config.MAX_FILE_SIZE_ERROR})
+    return await call_next(request)
+
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "https://linkedin-profile-optimizer.otterlab.dev"
-    ],
+    allow_origins=config.ALLOWED_ORIGINS_SET,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -44,6 +103,31 @@ app.add_middleware(
 
 # Initialize the workflow
 workflow = LinkedInOptimizerWorkflow()
+# Bind the workflow entry points once rather than resolving them per request
+run_optimization = workflow.run_optimization
+get_workflow_status_for_thread = workflow.get_workflow_status
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Validate configuration and verify (or create) the DynamoDB table before any request is served."""
+    # Raising here makes the server abort startup instead of serving with a broken configuration
+    if not validate_config():
+        raise RuntimeError("Configuration validation failed. Please check your environment variables.")
+
+    if storage.is_enabled():
+        await asyncio.to_thread(storage.ensure_table_exists)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Write out queued step progress and release shared HTTP connections and worker processes on application shutdown."""
+    await storage.flush_step_progress()
+    await close_llm_clients()
+    # The PDF parser is imported lazily, so there is no extraction pool unless a PDF was parsed
+    pdf_parser = sys.modules.get("utils.pdf_parser")
+    if pdf_parser is not None:
+        await asyncio.to_thread(pdf_parser.shutdown_extraction_pool)
 
 
 class OptimizationRequest(BaseModel):
@@ -60,6 +144,18 @@ class OptimizationResponse(BaseModel):
     error: Optional[str] = None
 
 
+# OptimizationResponse fields and their fallbacks when missing from workflow results
+RESPONSE_DEFAULTS = {
+    "success": False,
+    "status": "Unknown status",
+    "profile_data": None,
+    "analysis_results": None,
+    "content_results": None,
+    "summary": None,
+    "error": None
+}
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -85,6 +181,90 @@ async def health_check():
     }
 
 
+def open_upload_file() -> Tuple[BinaryIO, str]:
+    """
+    Open a temporary file to spool an uploaded PDF into.
+
+    On Linux the file is created with O_TMPFILE: it has no directory entry, so
+    closing it (or the process dying) frees it without an unlink. Other platforms,
+    and filesystems without O_TMPFILE support, fall back to a named temporary file.
+
+    Returns:
+        Tuple[BinaryIO, str]: Writable file and the path PyMuPDF can open it by
+    """
+    if hasattr(os, "O_TMPFILE"):
+        try:
+            fd = os.open(tempfile.gettempdir(), os.O_TMPFILE | os.O_RDWR, 0o600)
+            return open(fd, "wb"), f"{PROC_FD_PREFIX}{fd}"
+        except OSError:
+            pass
+    pdf_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
+    return pdf_file, pdf_file.name
+
+
+def close_upload_file(pdf_file: BinaryIO, pdf_path: str) -> None:
+    """
+    Close a file from open_upload_file, removing it if it was a named file.
+
+    Args:
+        pdf_file: File returned by open_upload_file
+        pdf_path: Path returned alongside it
+    """
+    pdf_file.close()
+    if not pdf_path.startswith(PROC_FD_PREFIX):
+        os.unlink(pdf_path)
+
+
+def get_cached_results(cache_key: bytes) -> Optional[Dict[str, Any]]:
+    """Return cached results for an identical earlier upload, if still fresh."""
+    entry = _result_cache.get(cache_key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        del _result_cache[cache_key]
+        return None
+    _result_cache.move_to_end(cache_key)
+    return entry[1]
+
+
+def cache_results(cache_key: bytes, results: Dict[str, Any]) -> None:
+    """Cache the results of a successful optimization."""
+    _result_cache[cache_key] = (time.monotonic() + RESULT_CACHE_TTL, dict(results))
+    _result_cache.move_to_end(cache_key)
+    if len(_result_cache) > RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+
+
+def reuse_cached_results(cached: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    """
+    Copy cached results for a new request that reuses them without any LLM calls.
+
+    The original run's token usage is replaced by zero usage marked as cached, both in
+    total and per step, and its step timings are dropped.
+
+    Args:
+        cached: Results cached from an earlier identical optimization
+        request_id: ID of the request reusing them
+
+    Returns:
+        Dict[str, Any]: Results to return and store for this request
+    """
+    usage = cached.get("token_usage") or {}
+    cached_usage = {
+        'model': usage.get('model', config.OPENAI_MODEL),
+        'prompt_tokens': 0,
+        'completion_tokens': 0,
+        'total_tokens': 0,
+        'cached': True
+    }
+    results = {**cached, "optimization_id": request_id, "step_timings": {}, "token_usage": cached_usage}
+    for key in ("profile_data", "analysis_results", "content_results"):
+        step_results = cached.get(key)
+        if isinstance(step_results, dict) and "token_usage" in step_results:
+            results[key] = {**step_results, "token_usage": {**step_results["token_usage"], **cached_usage}}
+    return results
+
+
 @app.post("/optimize-profile", response_model=OptimizationResponse)
 async def optimize_profile(
     file: UploadFile = File(...),
@@ -98,7 +278,7 @@ async def optimize_profile(
     Args:
         file: PDF file of the LinkedIn profile
         target_role: Optional target role/industry for optimization
-        optimization_id: Optional pre-generated optimization ID
+        optimization_id: Optional pre-generated optimization ID (a 32-character hex ID is generated if omitted)
         api_key: Optional OpenAI API key (uses server default if not provided)
 
     Returns:
@@ -106,109 +286,169 @@ async def optimize_profile(
     """
     # Validate API key if provided
     if api_key:
-        if not api_key.startswith('sk-'):
-            logger.warning(f"[ERROR] Invalid API key format provided")
+        if not API_KEY_RE.fullmatch(api_key):
+            logger.warning("[ERROR] Invalid API key format provided")
             raise HTTPException(
                 status_code=400,
-                detail="Invalid API key format. OpenAI API keys should start with 'sk-'"
+                detail="Invalid API key format. OpenAI API keys should start with 'sk-' and be at least 20 characters long"
             )
-        if len(api_key) < 20:
-            logger.warning(f"[ERROR] API key too short")
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid API key length"
-            )
-        logger.info(f"[INFO] Using user-provided API key")
+        logger.info("[INFO] Using user-provided API key")
     else:
         # Check if server has default API key configured
         if not config.OPENAI_API_KEY:
-            logger.warning(f"[ERROR] No API key provided and server has no default key")
+            logger.warning("[ERROR] No API key provided and server has no default key")
             raise HTTPException(
                 status_code=400,
                 detail="OpenAI API key required. Please provide your API key or contact administrator."
             )
-        logger.info(f"[INFO] Using server default API key")
+        logger.info("[INFO] Using server default API key")
 
-    # Use provided optimization_id or generate unique request ID for tracking (36-char UUID)
-    request_id = optimization_id or str(uuid.uuid4())
-    start_time = time.time()
+    # Use provided optimization_id or generate unique request ID for tracking (32-char hex)
+    request_id = optimization_id or secrets.token_hex(16)
+    start_time = time.perf_counter()
 
-    logger.info(f"[INFO] [REQ:{request_id}] Starting profile optimization request")
-    logger.info(f"[INFO] [REQ:{request_id}] File: {file.filename}, Size: {file.size} bytes, Target Role: {target_role or 'None'}")
+    logger.info("[INFO] [REQ:%s] Starting profile optimization request", request_id)
+    logger.info("[INFO] [REQ:%s] File: %s, Size: %s bytes, Target Role: %s", request_id, file.filename, file.size, target_role or 'None')
 
+    pdf_file = None
     try:
         # Validate file type
         if not file.filename.lower().endswith('.pdf'):
-            logger.warning(f"[ERROR] [REQ:{request_id}] Invalid file type: {file.filename}")
+            logger.warning("[ERROR] [REQ:%s] Invalid file type: %s", request_id, file.filename)
             raise HTTPException(
                 status_code=400,
                 detail="Only PDF files are accepted"
             )
 
-        # Check file size
-        if file.size > config.MAX_FILE_SIZE:
-            logger.warning(f"[ERROR] [REQ:{request_id}] File size too large: {file.size} bytes")
+        # Check file size up front when it is known
+        if file.size is not None and file.size > config.MAX_FILE_SIZE:
+            logger.warning("[ERROR] [REQ:%s] File size too large: %s bytes", request_id, file.size)
             raise HTTPException(
                 status_code=400,
-                detail=f"File size exceeds {config.MAX_FILE_SIZE // 1024 // 1024}MB limit"
+                detail=config.MAX_FILE_SIZE_ERROR
             )
 
-        # Read file content
-        logger.info(f"[INFO] [REQ:{request_id}] Reading PDF content...")
-        pdf_content = await file.read()
-
-        if not pdf_content:
-            logger.warning(f"[ERROR] [REQ:{request_id}] Empty file uploaded")
+        logger.info("[INFO] [REQ:%s] Reading PDF content...", request_id)
+        # Spool the upload to a temporary file in fixed-size chunks so the PDF is never held
+        # in memory, aborting as soon as the size limit is exceeded
+        pdf_file, pdf_path = open_upload_file()
+        pdf_digest = hashlib.blake2b(digest_size=16)
+        bytes_read = 0
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            bytes_read += len(chunk)
+            if bytes_read > config.MAX_FILE_SIZE:
+                logger.warning("[ERROR] [REQ:%s] File size too large: more than %s bytes read", request_id, config.MAX_FILE_SIZE)
+                raise HTTPException(
+                    status_code=400,
+                    detail=config.MAX_FILE_SIZE_ERROR
+                )
+            pdf_file.write(chunk)
+            pdf_digest.update(chunk)
+        # The file stays open until the workflow is done, so flush it for PyMuPDF to read
+        pdf_file.flush()
+
+        if not bytes_read:
+            logger.warning("[ERROR] [REQ:%s] Empty file uploaded", request_id)
             raise HTTPException(
                 status_code=400,
                 detail="Empty file uploaded"
             )
 
-        logger.info(f"[OK] [REQ:{request_id}] PDF content read successfully ({len(pdf_content)} bytes)")
-
-        # Run the optimization workflow with API key
-        logger.info(f"[INFO] [REQ:{request_id}] Starting LinkedIn profile optimization workflow...")
-        results = await workflow.run_optimization(
-            pdf_bytes=pdf_content,
-            target_role=target_role,
-            request_id=request_id,
-            api_key=api_key
-        )
+        logger.info("[OK] [REQ:%s] PDF content read successfully (%s bytes)", request_id, bytes_read)
+
+        # Results never cross API keys: the key is part of the digest
+        pdf_digest.update(b"\0" + (target_role or "").encode() + b"\0" + (api_key or "").encode())
+        cache_key = pdf_digest.digest()
+
+        cached = get_cached_results(cache_key)
+        if cached is not None:
+            logger.info("[CACHE] [REQ:%s] Identical upload optimized recently, reusing its results", request_id)
+            # Record the reused results under this request's ID, where the frontend polls for them,
+            # with the same started/completed progress history as a workflow run
+            results = reuse_cached_results(cached, request_id)
+            if storage.is_enabled():
+                await storage.save_step_progress(
+                    optimization_id=request_id,
+                    step_name="optimization_started",
+                    step_data={'target_role': target_role, 'pdf_size': bytes_read, 'cached': True},
+                    status="processing"
+                )
+                results["storage_saved"] = await storage.save_optimization_result(
+                    optimization_id=request_id,
+                    results=results,
+                    request_metadata={'target_role': target_role, 'file_size': bytes_read, 'cached': True}
+                )
+                await storage.save_step_progress(
+                    optimization_id=request_id,
+                    step_name="optimization_completed",
+                    step_data={'cached': True, 'success': True},
+                    status="completed"
+                )
+        else:
+            # Run the optimization workflow with API key
+            logger.info("[INFO] [REQ:%s] Starting LinkedIn profile optimization workflow...", request_id)
+            results = await run_optimization(
+                pdf_path=pdf_path,
+                target_role=target_role,
+                request_id=request_id,
+                api_key=api_key
+            )
+            if results.get("success"):
+                cache_results(cache_key, results)
 
-        processing_time = time.time() - start_time
-        logger.info(f"[OK] [REQ:{request_id}] Optimization completed successfully in {processing_time:.2f}s")
+        processing_time = time.perf_counter() - start_time
+        logger.info("[OK] [REQ:%s] Optimization completed successfully in %.2fs", request_id, processing_time)
 
         # Log summary of results
-        if results.get("success"):
+        if results.get("success") and logger.isEnabledFor(logging.INFO):
             summary = results.get("summary", {})
-            logger.info(f"[INFO] [REQ:{request_id}] Results Summary:")
-            logger.info(f"    - Profile Score: {summary.get('optimization_score', 'N/A')}/100")
-            logger.info(f"    - Completeness: {summary.get('profile_completeness', 'N/A')}%")
-            logger.info(f"    - Recommendations: {len(summary.get('key_improvements', []))}")
-            logger.info(f"    - Content Ideas: {results.get('content_results', {}).get('content_ideas', []) and len(results['content_results']['content_ideas']) or 0}")
+            logger.info("[INFO] [REQ:%s] Results Summary:", request_id)
+            logger.info("    - Profile Score: %s/100", summary.get('optimization_score', 'N/A'))
+            logger.info("    - Completeness: %s%%", summary.get('profile_completeness', 'N/A'))
+            logger.info("    - Recommendations: %s", len(summary.get('key_improvements', [])))
+            logger.info("    - Content Ideas: %s", len(results.get('content_results', {}).get('content_ideas') or []))
 
         # Return results
-        return OptimizationResponse(
-            success=results.get("success", False),
-            status=results.get("status", "Unknown status"),
-            profile_data=results.get("profile_data"),
-            analysis_results=results.get("analysis_results"),
-            content_results=results.get("content_results"),
-            summary=results.get("summary"),
-            error=results.get("error")
-        )
+        # Workflow results are JSON-native already; returning the response directly skips
+        # FastAPI's re-validation against OptimizationResponse (which still documents the schema)
+        return ORJSONResponse({key: results.get(key, default) for key, default in RESPONSE_DEFAULTS.items()})
 
     except HTTPException as e:
-        processing_time = time.time() - start_time
-        logger.error(f"[ERROR] [REQ:{request_id}] HTTP Error after {processing_time:.2f}s: {e.detail}")
+        processing_time = time.perf_counter() - start_time
+        logger.error("[ERROR] [REQ:%s] HTTP Error after %.2fs: %s", request_id, processing_time, e.detail)
         raise
     except Exception as e:
-        processing_time = time.time() - start_time
-        logger.error(f"[CRITICAL] [REQ:{request_id}] Unexpected error after {processing_time:.2f}s: {str(e)}")
+        processing_time = time.perf_counter() - start_time
+        logger.error("[CRITICAL] [REQ:%s] Unexpected error after %.2fs: %s", request_id, processing_time, e)
         raise HTTPException(
             status_code=500,
             detail=f"Internal server error: {str(e)}"
         )
+    finally:
+        # The workflow has finished with the uploaded PDF
+        if pdf_file is not None:
+            try:
+                close_upload_file(pdf_file, pdf_path)
+            except OSError as e:
+                logger.warning("[WARN] [REQ:%s] Failed to remove temporary PDF %s: %s", request_id, pdf_path, e)
+
+
+def validate_optimization_id(optimization_id: str) -> None:
+    """
+    Reject malformed optimization IDs.
+
+    Args:
+        optimization_id: Optimization ID taken from the request path
+
+    Raises:
+        HTTPException: 400 if the ID does not match OPTIMIZATION_ID_RE
+    """
+    if not OPTIMIZATION_ID_RE.fullmatch(optimization_id):
+        logger.warning("[ERROR] [ID:%s] Invalid optimization ID format", optimization_id)
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid optimization ID format"
+        )
 
 
 @app.get("/results/{optimization_id}")
@@ -222,39 +462,35 @@ async def get_optimization_results(optimization_id: str):
     Returns:
         Optimization results if found
     """
-    start_time = time.time()
-    logger.info(f"[INFO] [ID:{optimization_id}] Retrieving optimization results...")
+    start_time = time.perf_counter()
+    logger.info("[INFO] [ID:%s] Retrieving optimization results...", optimization_id)
 
     try:
-        # Validate ID format (basic validation)
-        if len(optimization_id) < 6 or len(optimization_id) > 50:
-            logger.warning(f"[ERROR] [ID:{optimization_id}] Invalid optimization ID format")
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid optimization ID format"
-            )
+        # Validate ID format before touching DynamoDB
+        validate_optimization_id(optimization_id)
 
         # Retrieve results from DynamoDB
         results = await storage.get_optimization_result(optimization_id)
 
         if results is None:
-            retrieval_time = time.time() - start_time
-            logger.warning(f"[NOTFOUND] [ID:{optimization_id}] Results not found after {retrieval_time:.2f}s")
+            retrieval_time = time.perf_counter() - start_time
+            logger.warning("[NOTFOUND] [ID:%s] Results not found after %.2fs", optimization_id, retrieval_time)
             raise HTTPException(
                 status_code=404,
                 detail="Optimization results not found"
             )
 
-        retrieval_time = time.time() - start_time
-        logger.info(f"[OK] [ID:{optimization_id}] Results retrieved successfully in {retrieval_time:.2f}s")
+        retrieval_time = time.perf_counter() - start_time
+        logger.info("[OK] [ID:%s] Results retrieved successfully in %.2fs", optimization_id, retrieval_time)
 
-        return results
+        # Stored results are decoded JSON already, so render them directly and skip jsonable_encoder
+        return ORJSONResponse(results)
 
     except HTTPException:
         raise
     except Exception as e:
-        retrieval_time = time.time() - start_time
-        logger.error(f"[CRITICAL] [ID:{optimization_id}] Error retrieving results after {retrieval_time:.2f}s: {str(e)}")
+        retrieval_time = time.perf_counter() - start_time
+        logger.error("[CRITICAL] [ID:%s] Error retrieving results after %.2fs: %s", optimization_id, retrieval_time, e)
         raise HTTPException(
             status_code=500,
             detail=f"Error retrieving optimization results: {str(e)}"
@@ -272,51 +508,40 @@ async def get_optimization_progress(optimization_id: str):
     Returns:
         Progress information including current step and completed steps
     """
-    start_time = time.time()
-    logger.info(f"[INFO] [ID:{optimization_id}] Retrieving optimization progress...")
+    start_time = time.perf_counter()
+    logger.info("[INFO] [ID:%s] Retrieving optimization progress...", optimization_id)
 
     try:
-        # Validate ID format (basic validation)
-        if len(optimization_id) < 6 or len(optimization_id) > 50:
-            logger.warning(f"[ERROR] [ID:{optimization_id}] Invalid optimization ID format")
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid optimization ID format"
-            )
+        # Validate ID format before touching DynamoDB
+        validate_optimization_id(optimization_id)
 
         progress = await storage.get_optimization_progress(optimization_id)
 
         if not progress:
-            retrieve_time = time.time() - start_time
-            logger.info(f"[INFO] [ID:{optimization_id}] Progress not found after {retrieve_time:.2f}s")
+            retrieve_time = time.perf_counter() - start_time
+            logger.info("[INFO] [ID:%s] Progress not found after %.2fs", optimization_id, retrieve_time)
             raise HTTPException(
                 status_code=404,
                 detail="Optimization progress not found"
             )
 
-        retrieve_time = time.time() - start_time
-        logger.info(f"[OK] [ID:{optimization_id}] Progress retrieved in {retrieve_time:.2f}s")
+        retrieve_time = time.perf_counter() - start_time
+        logger.info("[OK] [ID:%s] Progress retrieved in %.2fs", optimization_id, retrieve_time)
 
         # Calculate progress percentage and estimated completion
         completed_steps = progress.get('processing_steps', [])
-        all_steps = ['optimization_started', 'profile_extraction', 'profile_analysis', 'content_generation', 'optimization_completed']
 
-        progress_percentage = (len(completed_steps) / len(all_steps)) * 100
         current_step = progress.get('current_step', 'unknown')
         status = progress.get('status', 'unknown')
 
-        # If status is completed, ensure progress is 100%
-        if status == 'completed':
-            progress_percentage = 100.0
+        # Look up the percentage for the completed step count; a completed status is always 100%
+        progress_percentage = PROGRESS_PERCENTAGES[-1] if status == 'completed' else PROGRESS_PERCENTAGES[min(len(completed_steps), ALL_STEPS_COUNT)]
 
         # Estimate completion time based on current progress
         step_details = progress.get('step_details', {})
-        total_elapsed = 0
-        for step_name, details in step_details.items():
-            total_elapsed += details.get('duration', 0)
 
         # Rough estimation: each step takes about 30 seconds on average
-        remaining_steps = len(all_steps) - len(completed_steps)
+        remaining_steps = ALL_STEPS_COUNT - len(completed_steps)
         estimated_remaining = remaining_steps * 30  # seconds
 
         return {
@@ -324,7 +549,7 @@ async def get_optimization_progress(optimization_id: str):
             "status": status,
             "current_step": current_step,
             "completed_steps": completed_steps,
-            "progress_percentage": round(progress_percentage, 1),
+            "progress_percentage": progress_percentage,
             "step_details": step_details,
             "estimated_remaining_seconds": estimated_remaining if status == 'processing' else 0,
             "created_at": progress.get('created_at'),
@@ -334,8 +559,8 @@ async def get_optimization_progress(optimization_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        retrieve_time = time.time() - start_time
-        logger.error(f"[ERROR] [ID:{optimization_id}] Error retrieving progress after {retrieve_time:.2f}s: {str(e)}")
+        retrieve_time = time.perf_counter() - start_time
+        logger.error("[ERROR] [ID:%s] Error retrieving progress after %.2fs: %s", optimization_id, retrieve_time, e)
         raise HTTPException(
             status_code=500,
             detail="Internal server error while retrieving progress"
@@ -354,7 +579,7 @@ async def get_workflow_status(thread_id: str):
         Current workflow status
     """
     try:
-        status = await workflow.get_workflow_status(thread_id)
+        status = await get_workflow_status_for_thread(thread_id)
         return status
     except Exception as e:
         raise HTTPException(
@@ -371,15 +596,18 @@ if __name__ == "__main__":
 
     # Log startup information
     logger.info("[CONFIG] Initializing LinkedIn Profile Optimizer API...")
-    logger.info(f"[SERVER] Server will start on {config.HOST}:{config.PORT}")
-    logger.info(f"[INFO] Debug mode: {config.DEBUG}")
-    logger.info(f"[LLM] OpenAI Model: {config.OPENAI_MODEL}")
+    logger.info("[SERVER] Server will start on %s:%s", config.HOST, config.PORT)
+    logger.info("[INFO] Debug mode: %s", config.DEBUG)
+    logger.info("[LLM] OpenAI Model: %s", config.OPENAI_MODEL)
     logger.info("[OK] Application startup complete")
 
     uvicorn.run(
         "main:app",
         host=config.HOST,
         port=config.PORT,
+        # C-accelerated event loop and HTTP parser ("auto" selects uvloop wherever it is installed)
+        loop="auto",
+        http="httptools",
         reload=config.DEBUG,
         log_level="info"
     )
@@ -0,0 +1,60 @@
+"""Tests for the content generator agent."""
+
+import asyncio
+
+import orjson
+from langchain_core.messages import AIMessage
+
+import agents.content_generator as content_generator
+from agents.content_generator import ContentGeneratorAgent
+
+PROFILE = {'personal_info': {'name': 'Jane Doe'}, 'summary': 'Builds things'}
+ANALYSIS = {'overall_score': 80, 'next_steps': ['Add a headline']}
+CONTENT = {'content_strategy': {'posting_frequency': 'weekly'}, 'content_ideas': [], 'sample_posts': []}
+
+
+class FakeLLM:
+    """ChatOpenAI stand-in that counts calls and returns a fixed JSON response."""
+
+    model_name = "test-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        return AIMessage(
+            content=orjson.dumps(CONTENT).decode(),
+            response_metadata={'token_usage': {'prompt_tokens': 10, 'completion_tokens': 5, 'total_tokens': 15}}
+        )
+
+
+def make_agent(api_key):
+    agent = ContentGeneratorAgent(api_key=api_key)
+    agent.llm = FakeLLM()
+    return agent
+
+
+def test_cached_content_is_not_shared_across_api_keys():
+    content_generator._response_cache.clear()
+    first = make_agent("sk-first")
+    second = make_agent("sk-second")
+
+    asyncio.run(first.generate_content(PROFILE, ANALYSIS))
+    results = asyncio.run(second.generate_content(PROFILE, ANALYSIS))
+
+    assert first.llm.calls == 1
+    assert second.llm.calls == 1
+    assert results['token_usage']['total_tokens'] == 15
+
+
+def test_cached_content_is_reused_for_the_same_api_key():
+    content_generator._response_cache.clear()
+    agent = make_agent("sk-first")
+
+    generated = asyncio.run(agent.generate_content(PROFILE, ANALYSIS))
+    results = asyncio.run(agent.generate_content(PROFILE, ANALYSIS))
+
+    assert agent.llm.calls == 1
+    assert results['content_strategy'] == generated['content_strategy']
+    assert results['token_usage'] == {'model': 'test-model', 'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0}
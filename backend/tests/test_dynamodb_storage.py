@@ -0,0 +1,209 @@
+"""Tests for DynamoDB storage."""
+
+import asyncio
+import logging
+from decimal import Decimal
+
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.exceptions import ClientError
+
+from utils.dynamodb_storage import DynamoDBStorage
+
+_deserializer = TypeDeserializer()
+NOW = "2026-01-01T00:00:00+00:00"
+
+
+class FakeTable:
+    """DynamoDB Table stand-in that serves one item and counts reads."""
+
+    def __init__(self, item):
+        self.item = item
+        self.reads = 0
+
+    def get_item(self, Key, **kwargs):
+        self.reads += 1
+        return {'Item': dict(self.item)}
+
+
+def make_storage(item):
+    storage = DynamoDBStorage()
+    storage.table = FakeTable(item)
+    return storage, storage.table
+
+
+def test_completed_item_without_results_is_not_cached():
+    storage, table = make_storage({
+        'optimization_id': 'opt-1',
+        'status': 'completed',
+        'current_step': 'optimization_completed'
+    })
+
+    asyncio.run(storage._get_item('opt-1'))
+    asyncio.run(storage._get_item('opt-1'))
+
+    assert table.reads == 2
+    assert storage._get_cached_item('opt-1') is None
+
+
+def test_completed_item_with_results_is_cached():
+    storage, table = make_storage({
+        'optimization_id': 'opt-1',
+        'status': 'completed',
+        'current_step': 'optimization_completed',
+        'results': '{}'
+    })
+
+    asyncio.run(storage._get_item('opt-1'))
+    item = asyncio.run(storage._get_item('opt-1'))
+
+    assert table.reads == 1
+    assert item['results'] == '{}'
+
+
+def make_queueing_storage():
+    storage = DynamoDBStorage()
+    storage.enabled = True
+    written = []
+    storage._write_step_progress = lambda optimization_id, step_name, *args: written.append((optimization_id, step_name))
+    return storage, written
+
+
+def test_queued_step_progress_is_written_in_order_and_drained():
+    storage, written = make_queueing_storage()
+
+    async def run():
+        for step_name in ("optimization_started", "profile_extraction", "profile_analysis"):
+            await storage.save_step_progress("opt-1", step_name)
+        await storage.flush_step_progress()
+
+    asyncio.run(run())
+
+    assert written == [("opt-1", "optimization_started"), ("opt-1", "profile_extraction"), ("opt-1", "profile_analysis")]
+    assert storage._step_queue.empty()
+    assert storage._step_flusher is None
+
+
+def test_restarted_flusher_keeps_queued_writes():
+    storage, written = make_queueing_storage()
+
+    async def run():
+        await storage.save_step_progress("opt-1", "optimization_started")
+        # The flusher dies before applying the queued write
+        storage._step_flusher.cancel()
+        await asyncio.sleep(0)
+        await storage.save_step_progress("opt-1", "profile_extraction")
+        await storage.flush_step_progress()
+
+    asyncio.run(run())
+
+    assert written == [("opt-1", "optimization_started"), ("opt-1", "profile_extraction")]
+
+
+def conditional_check_failed():
+    return ClientError({'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'The conditional request failed'}}, 'UpdateItem')
+
+
+class FakeClient:
+    """Low-level DynamoDB client stand-in that applies step progress updates to one in-memory item."""
+
+    def __init__(self, item=None):
+        self.item = item
+        self.conditions = []
+
+    def update_item(self, TableName, Key, UpdateExpression, ConditionExpression,
+                    ExpressionAttributeNames, ExpressionAttributeValues):
+        self.conditions.append(ConditionExpression)
+        values = {name: _deserializer.deserialize(value) for name, value in ExpressionAttributeValues.items()}
+        item = self.item or {}
+        tracked = 'step_details' in item
+        repeated = values[':step'] in item.get('processing_steps', [])
+
+        if ConditionExpression == "attribute_not_exists(#sd)":
+            matches = not tracked
+        elif "NOT contains" in ConditionExpression:
+            matches = tracked and not repeated
+        else:
+            matches = tracked and repeated
+        if not matches:
+            raise conditional_check_failed()
+
+        if ':step_details' in values:
+            item['processing_steps'] = item.get('processing_steps', []) + values[':steps']
+            item['step_details'] = values[':step_details']
+        else:
+            if ':steps' in values:
+                item['processing_steps'] = item['processing_steps'] + values[':steps']
+            item['step_details'][ExpressionAttributeNames['#step']] = values[':details']
+        item['current_step'] = values[':step']
+        item['status'] = values[':status']
+        self.item = item
+
+
+def make_writing_storage(client):
+    storage = DynamoDBStorage()
+    storage.client = client
+    return storage
+
+
+def test_first_step_creates_progress_tracking():
+    client = FakeClient()
+    storage = make_writing_storage(client)
+
+    assert storage._write_step_progress("opt-1", "optimization_started", {'target_role': 'Engineer'}, "processing", NOW)
+
+    assert client.item['processing_steps'] == ["optimization_started"]
+    assert client.item['step_details']['optimization_started']['data'] == {'target_role': 'Engineer'}
+    assert client.item['current_step'] == "optimization_started"
+    assert client.conditions[-1] == "attribute_not_exists(#sd)"
+
+
+def test_first_step_keeps_results_saved_earlier():
+    client = FakeClient({'results': b'compressed'})
+    storage = make_writing_storage(client)
+
+    assert storage._write_step_progress("opt-1", "optimization_started", None, "processing", NOW)
+
+    assert client.item['results'] == b'compressed'
+    assert client.item['processing_steps'] == ["optimization_started"]
+
+
+def test_new_step_is_appended():
+    client = FakeClient()
+    storage = make_writing_storage(client)
+    storage._write_step_progress("opt-1", "optimization_started", None, "processing", NOW)
+    client.conditions.clear()
+
+    assert storage._write_step_progress("opt-1", "profile_extraction", {'duration': 1.5}, "processing", NOW)
+
+    assert client.item['processing_steps'] == ["optimization_started", "profile_extraction"]
+    assert client.item['step_details']['profile_extraction']['duration'] == Decimal('1.5')
+    assert len(client.conditions) == 1
+
+
+def test_repeated_step_refreshes_its_details_only():
+    client = FakeClient()
+    storage = make_writing_storage(client)
+    storage._write_step_progress("opt-1", "optimization_started", None, "processing", NOW)
+    storage._write_step_progress("opt-1", "profile_extraction", {'success': True}, "processing", NOW)
+
+    assert storage._write_step_progress("opt-1", "profile_extraction", {'success': False}, "failed", NOW)
+
+    assert client.item['processing_steps'] == ["optimization_started", "profile_extraction"]
+    assert client.item['step_details']['profile_extraction']['data'] == {'success': False}
+    assert client.item['status'] == "failed"
+
+
+def test_unmatched_item_state_fails_the_write(caplog):
+    class RejectingClient(FakeClient):
+        def update_item(self, **kwargs):
+            self.conditions.append(kwargs['ConditionExpression'])
+            raise conditional_check_failed()
+
+    client = RejectingClient()
+    storage = make_writing_storage(client)
+
+    with caplog.at_level(logging.ERROR):
+        assert storage._write_step_progress("opt-1", "optimization_started", None, "processing", NOW) is False
+
+    assert len(client.conditions) == 3
+    assert "No step progress update matched the stored item" in caplog.text
@@ -0,0 +1,52 @@
+"""Tests for the streaming JSON section parser."""
+
+import orjson
+import pytest
+
+from utils.json_stream import SectionStreamParser
+
+
+def feed_all(parser, chunks):
+    completed = []
+    for chunk in chunks:
+        completed.extend(parser.feed(chunk))
+    return completed
+
+
+def test_members_split_across_chunks():
+    parser = SectionStreamParser()
+
+    completed = feed_all(parser, ['{"hea', 'dline": "Sen', 'ior", "sc', 'ore": 8', '5, "skills": ["Py', 'thon"]', '}'])
+
+    assert completed == [("headline", "Senior"), ("score", 85), ("skills", ["Python"])]
+    assert parser.complete is True
+    assert orjson.loads(parser.text) == dict(completed)
+
+
+def test_escaped_quotes_inside_strings():
+    parser = SectionStreamParser()
+    text = '{"summary": "She said \\"hi, {there}\\"", "key \\"quoted\\"": [1]}'
+    # Split right after a backslash so the escape spans two chunks
+    split = text.index('\\') + 1
+
+    completed = feed_all(parser, [text[:split], text[split:]])
+
+    assert completed == [("summary", 'She said "hi, {there}"'), ('key "quoted"', [1])]
+    assert parser.complete is True
+
+
+@pytest.mark.parametrize("text", ['[{"a": 1}]', '  "profile"', '42'])
+def test_non_object_input_raises(text):
+    parser = SectionStreamParser()
+
+    with pytest.raises(orjson.JSONDecodeError):
+        parser.feed(text)
+
+
+def test_truncated_stream_stays_incomplete():
+    parser = SectionStreamParser()
+
+    completed = feed_all(parser, ['{"name": "Jane", "experience": [{"title": ', '"Engi'])
+
+    assert completed == [("name", "Jane")]
+    assert parser.complete is False
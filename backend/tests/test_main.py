@@ -0,0 +1,67 @@
+"""Tests for the API handlers."""
+
+from fastapi.testclient import TestClient
+
+import main
+
+API_KEY = "sk-" + "a" * 32
+TOKEN_USAGE = {'model': 'test-model', 'prompt_tokens': 1, 'completion_tokens': 2, 'total_tokens': 3}
+
+
+class FakeStorage:
+    """DynamoDB storage stand-in that records what the handlers save."""
+
+    def __init__(self):
+        self.steps = []
+        self.results = {}
+
+    def is_enabled(self):
+        return True
+
+    async def save_step_progress(self, optimization_id, step_name, step_data=None, status="processing"):
+        self.steps.append((optimization_id, step_name, status))
+        return True
+
+    async def save_optimization_result(self, optimization_id, results, request_metadata=None):
+        self.results[optimization_id] = results
+        return True
+
+
+def test_identical_upload_reuses_results_without_token_usage(monkeypatch):
+    storage = FakeStorage()
+    runs = []
+
+    async def run_optimization(pdf_path, target_role, request_id, api_key):
+        runs.append(request_id)
+        return {
+            'success': True,
+            'status': 'done',
+            'content_results': {'content_ideas': [], 'token_usage': TOKEN_USAGE},
+            'step_timings': {'profile_extraction': 1.5},
+            'token_usage': {**TOKEN_USAGE, 'total_tokens': 9}
+        }
+
+    monkeypatch.setattr(main, "storage", storage)
+    monkeypatch.setattr(main, "run_optimization", run_optimization)
+    main._result_cache.clear()
+    client = TestClient(main.app)
+
+    for request_id in ("first-request", "second-request"):
+        response = client.post(
+            "/optimize-profile",
+            files={'file': ('profile.pdf', b'%PDF-1.4 profile', 'application/pdf')},
+            data={'api_key': API_KEY, 'optimization_id': request_id}
+        )
+        assert response.status_code == 200
+
+    assert runs == ["first-request"]
+    assert response.json()['content_results']['token_usage']['total_tokens'] == 0
+
+    reused = storage.results["second-request"]
+    assert reused['optimization_id'] == "second-request"
+    assert reused['token_usage'] == {'model': 'test-model', 'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0, 'cached': True}
+    assert reused['step_timings'] == {}
+    assert storage.steps == [
+        ("second-request", "optimization_started", "processing"),
+        ("second-request", "optimization_completed", "completed")
+    ]
@@ -0,0 +1,71 @@
+"""Tests for the profile analyzer agent."""
+
+import asyncio
+
+import orjson
+import pytest
+from langchain_core.messages import AIMessage
+
+from agents.profile_analyzer import ProfileAnalyzerAgent
+
+
+class FakeLLM:
+    """ChatOpenAI stand-in whose batch calls finish in reverse order.
+
+    A prompt naming "Broken" fails the call and one naming "Garbled" returns invalid JSON;
+    any other prompt gets an analysis scored by the profile's position in the batch.
+    """
+
+    model_name = "test-model"
+
+    async def abatch(self, messages_list, config=None, return_exceptions=False):
+        async def respond(index, messages):
+            await asyncio.sleep(0.01 * (len(messages_list) - index))
+            prompt = messages[-1].content
+            if "Broken" in prompt:
+                raise RuntimeError("rate limited")
+            if "Garbled" in prompt:
+                return AIMessage(content="not json")
+            return AIMessage(content=orjson.dumps({'overall_score': index * 10}).decode())
+
+        return await asyncio.gather(*(respond(index, messages) for index, messages in enumerate(messages_list)),
+                                    return_exceptions=return_exceptions)
+
+
+def make_agent():
+    agent = ProfileAnalyzerAgent(api_key="sk-test")
+    agent.llm = FakeLLM()
+    return agent
+
+
+def profile(name):
+    return {'personal_info': {'name': name}}
+
+
+def test_batch_results_follow_profile_order():
+    agent = make_agent()
+
+    results = asyncio.run(agent.analyze_profiles([profile("Ann"), profile("Bob"), profile("Cy")], [None, "Engineer", None]))
+
+    assert [result['overall_score'] for result in results] == [0, 10, 20]
+
+
+def test_failed_profiles_are_reported_without_failing_the_batch():
+    agent = make_agent()
+
+    results = asyncio.run(agent.analyze_profiles(
+        [profile("Ann"), profile("Broken"), profile("Garbled"), profile("Dee")],
+        [None, None, None, None]
+    ))
+
+    assert results[0]['overall_score'] == 0
+    assert results[1] == {'error': "Error analyzing profile: rate limited"}
+    assert list(results[2]) == ['error']
+    assert results[3]['overall_score'] == 30
+
+
+def test_mismatched_target_roles_are_rejected():
+    agent = make_agent()
+
+    with pytest.raises(ValueError):
+        asyncio.run(agent.analyze_profiles([profile("Ann"), profile("Bob")], [None]))
@@ -0,0 +1,56 @@
+"""Tests for the profile collector agent."""
+
+import asyncio
+
+from langchain_core.messages import AIMessageChunk
+
+import agents.profile_collector as profile_collector
+from agents.profile_collector import ProfileCollectorAgent
+
+PDF_TEXT = "Jane Doe\nSoftware Engineer\nBuilds things"
+RESPONSE_CHUNKS = ['{"personal_info": {"name": "Jane Doe", "title": "Software Engineer"}, ', '"summary": "Builds things", ', '"skills": ["Python"]}']
+
+
+class FakeLLM:
+    """ChatOpenAI stand-in that counts calls and streams a fixed JSON response."""
+
+    model_name = "test-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def astream(self, messages, **kwargs):
+        self.calls += 1
+        for content in RESPONSE_CHUNKS:
+            yield AIMessageChunk(content=content)
+
+
+def make_agent(api_key):
+    agent = ProfileCollectorAgent(api_key=api_key)
+    agent.llm = FakeLLM()
+    return agent
+
+
+def test_cached_profile_is_not_shared_across_api_keys():
+    profile_collector._profile_cache.clear()
+    first = make_agent("sk-first")
+    second = make_agent("sk-second")
+
+    asyncio.run(first.extract_profile_data_from_text(PDF_TEXT))
+    profile = asyncio.run(second.extract_profile_data_from_text(PDF_TEXT))
+
+    assert first.llm.calls == 1
+    assert second.llm.calls == 1
+    assert profile['personal_info']['name'] == "Jane Doe"
+
+
+def test_cached_profile_is_reused_for_the_same_api_key():
+    profile_collector._profile_cache.clear()
+    agent = make_agent("sk-first")
+
+    extracted = asyncio.run(agent.extract_profile_data_from_text(PDF_TEXT))
+    profile = asyncio.run(agent.extract_profile_data_from_text(PDF_TEXT))
+
+    assert agent.llm.calls == 1
+    assert profile['skills'] == extracted['skills']
+    assert profile['token_usage'] == {'model': 'test-model', 'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0}
@@ -0,0 +1,47 @@
+"""Tests for the prompt loader's JSON copy."""
+
+import json
+import os
+
+from utils.prompt_loader import PromptLoader
+
+PLANTED = {"content_generator": {"system_prompt": "planted", "user_prompt": "planted"}}
+
+
+def write_copy(directory, loader, prompts, size_delta=0):
+    stat = loader.prompts_file.stat()
+    json_file = directory / "prompts.json"
+    json_file.write_text(json.dumps({
+        "source_mtime_ns": stat.st_mtime_ns,
+        "source_size": stat.st_size + size_delta,
+        "prompts": prompts
+    }))
+    return json_file, (stat.st_mtime_ns, stat.st_size)
+
+
+def test_json_copy_in_private_dir_is_used(tmp_path):
+    loader = PromptLoader()
+    directory = tmp_path / "cache"
+    directory.mkdir(mode=0o700)
+    json_file, source = write_copy(directory, loader, PLANTED)
+
+    assert loader._parse_prompts(json_file, source) == PLANTED
+
+
+def test_stale_json_copy_is_ignored(tmp_path):
+    loader = PromptLoader()
+    directory = tmp_path / "cache"
+    directory.mkdir(mode=0o700)
+    json_file, source = write_copy(directory, loader, PLANTED, size_delta=1)
+
+    assert loader._parse_prompts(json_file, source) == loader.prompts
+
+
+def test_json_copy_in_shared_dir_is_ignored(tmp_path):
+    loader = PromptLoader()
+    directory = tmp_path / "cache"
+    directory.mkdir()
+    os.chmod(directory, 0o777)
+    json_file, source = write_copy(directory, loader, PLANTED)
+
+    assert loader._parse_prompts(json_file, source) == loader.prompts
@@ -0,0 +1,80 @@
+"""Tests for the LinkedIn Profile Optimizer workflow."""
+
+import asyncio
+
+import workflows.linkedin_optimizer_workflow as workflow_module
+from workflows.linkedin_optimizer_workflow import LinkedInOptimizerWorkflow
+
+TOKEN_USAGE = {'model': 'test-model', 'prompt_tokens': 1, 'completion_tokens': 2, 'total_tokens': 3}
+
+
+class FakeStorage:
+    """DynamoDB storage stand-in that records what the workflow saves."""
+
+    def __init__(self):
+        self.steps = []
+        self.results = {}
+
+    def is_enabled(self):
+        return True
+
+    async def save_step_progress(self, optimization_id, step_name, step_data=None, status="processing"):
+        self.steps.append((optimization_id, step_name, status))
+        return True
+
+    async def save_optimization_result(self, optimization_id, results, request_metadata=None):
+        self.results[optimization_id] = results
+        return True
+
+
+class FakeCollector:
+    def extract_text_from_bytes(self, pdf_bytes, request_id=None):
+        return "Jane Doe - Software Engineer"
+
+    async def extract_profile_data_from_text(self, pdf_content, request_id=None):
+        return {
+            'personal_info': {'name': 'Jane Doe', 'title': 'Software Engineer'},
+            'summary': 'Builds things',
+            'experience': [{'title': 'Engineer'}],
+            'skills': ['Python'],
+            'token_usage': TOKEN_USAGE
+        }
+
+
+class FakeAnalyzer:
+    async def analyze_profile(self, profile_data, target_role=None, request_id=None, pdf_content=None):
+        return {'overall_score': 80, 'next_steps': ['Add a headline'], 'token_usage': TOKEN_USAGE}
+
+
+class FakeGenerator:
+    async def generate_content(self, profile_data, profile_analysis, request_id=None):
+        return {
+            'content_strategy': {'content_pillars': ['Engineering'], 'posting_frequency': 'weekly'},
+            'content_ideas': [{'title': 'Idea'}],
+            'sample_posts': [],
+            'token_usage': TOKEN_USAGE
+        }
+
+
+def test_run_optimization_saves_progress_with_storage_enabled(monkeypatch):
+    storage = FakeStorage()
+    monkeypatch.setattr(workflow_module, "storage", storage)
+    monkeypatch.setattr(workflow_module, "get_profile_collector", lambda api_key: FakeCollector())
+    monkeypatch.setattr(workflow_module, "get_profile_analyzer", lambda api_key: FakeAnalyzer())
+    monkeypatch.setattr(workflow_module, "get_content_generator", lambda api_key: FakeGenerator())
+
+    workflow = LinkedInOptimizerWorkflow(api_key="sk-test")
+    results = asyncio.run(workflow.run_optimization(pdf_bytes=b"%PDF-1.4", request_id="req-1"))
+
+    assert results["success"] is True
+    assert results["storage_saved"] is True
+    assert results["token_usage"]["total_tokens"] == 9
+    assert storage.results["req-1"] is results
+    assert [step for _, step, _ in storage.steps] == [
+        "optimization_started",
+        "profile_extraction",
+        "profile_analysis",
+        "content_generation",
+        "optimization_completed"
+    ]
+    assert storage.steps[-1][2] == "completed"
@@ -4,13 +4,18 @@ DynamoDB storage utility for LinkedIn Profile Optimizer results.
 This module handles storing and retrieving optimization results from DynamoDB.
 """
 
-import json
+import asyncio
 import logging
 import time
+import zlib
+from collections import OrderedDict
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import boto3
+import orjson
+from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 from botocore.exceptions import ClientError, NoCredentialsError
 from botocore.config import Config as BotoConfig
 
@@ -18,10 +23,34 @@ from config import config
 
 logger = logging.getLogger(__name__)
 
+# Finished optimizations never change, so their items are cached briefly to
+# serve clients that keep polling /results and /progress without DynamoDB reads
+_TERMINAL_CACHE_TTL = 60.0
+_TERMINAL_CACHE_SIZE = 1024
+
+# GSI serving recent-optimization listings: partition on status, newest first by created_at
+_RECENT_INDEX_NAME = 'gsi_status_created_at'
+
+# Items expire 30 days after their last write
+_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Attributes read by the progress endpoint (everything except the results blob)
+_PROGRESS_PROJECTION = 'optimization_id, #st, current_step, processing_steps, step_details, created_at, updated_at'
+
+# Converters between Python values and the typed attribute values of the low-level client
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+# Codec recorded next to compressed results; items without it hold plain JSON text
+_RESULTS_CODEC = 'zlib'
+
 
 def convert_floats_to_decimal(obj: Any) -> Any:
     """
-    Recursively convert all float values to Decimal for DynamoDB compatibility.
+    Convert all float values to Decimal for DynamoDB compatibility.
+
+    Dicts and lists are updated in place rather than copied, so callers must
+    pass payloads they own (the storage methods build theirs per call).
 
     Args:
         obj: Any Python object (dict, list, float, etc.)
@@ -29,18 +58,43 @@ def convert_floats_to_decimal(obj: Any) -> Any:
     Returns:
         Same object structure with floats converted to Decimals
     """
-    if isinstance(obj, float):
-        return Decimal(str(obj))
-    elif isinstance(obj, dict):
-        return {k: convert_floats_to_decimal(v) for k, v in obj.items()}
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(value, float):
+                obj[key] = Decimal(str(value))
+            elif isinstance(value, (dict, list, tuple)):
+                obj[key] = convert_floats_to_decimal(value)
+        return obj
     elif isinstance(obj, list):
-        return [convert_floats_to_decimal(item) for item in obj]
+        for i, value in enumerate(obj):
+            if isinstance(value, float):
+                obj[i] = Decimal(str(value))
+            elif isinstance(value, (dict, list, tuple)):
+                obj[i] = convert_floats_to_decimal(value)
+        return obj
+    elif isinstance(obj, float):
+        return Decimal(str(obj))
     elif isinstance(obj, tuple):
         return tuple(convert_floats_to_decimal(item) for item in obj)
     else:
         return obj
 
 
+def _load_results(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Decode the stored results of an item.
+
+    Args:
+        item: DynamoDB item holding a 'results' attribute
+
+    Returns:
+        Dict[str, Any]: Parsed optimization results
+    """
+    if item.get('results_codec') == _RESULTS_CODEC:
+        return orjson.loads(zlib.decompress(item['results'].value))
+    return orjson.loads(item['results'])
+
+
 class DynamoDBStorage:
     """Utility class for storing and retrieving optimization results in DynamoDB."""
 
@@ -48,6 +102,12 @@ class DynamoDBStorage:
         """Initialize DynamoDB client."""
         self.table_name = config.DYNAMODB_TABLE_NAME
         self.region = config.AWS_REGION
+        self._terminal_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Step progress writes are queued and applied by a background task
+        self._step_queue: Optional[asyncio.Queue] = None
+        self._step_flusher: Optional[asyncio.Task] = None
+        # Set once the table has been confirmed to exist
+        self._table_verified = False
 
         # Configure boto3 with retry settings
         boto_config = BotoConfig(
@@ -66,10 +126,22 @@ class DynamoDBStorage:
                 aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
                 config=boto_config
             )
+            # Resolve the Table resource once instead of on every call
+            self.table = self.dynamodb.Table(self.table_name)
+            # Low-level client for the hot progress paths, skipping the resource layer. It must be
+            # separate: the resource installs its type-transform hooks on its own meta.client
+            self.client = boto3.client(
+                'dynamodb',
+                aws_access_key_id=config.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
+                config=boto_config
+            )
             self.enabled = True
-            logger.info(f"[DB] DynamoDB Storage initialized for table: {self.table_name}")
+            logger.info("[DB] DynamoDB Storage initialized for table: %s", self.table_name)
         else:
             self.dynamodb = None
+            self.table = None
+            self.client = None
             self.enabled = False
             logger.warning("[WARN] DynamoDB Storage disabled - AWS credentials not configured")
 
@@ -77,6 +149,65 @@ class DynamoDBStorage:
         """Check if DynamoDB storage is enabled."""
         return self.enabled
 
+    def _get_cached_item(self, optimization_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached item of a finished optimization, if still fresh."""
+        entry = self._terminal_cache.get(optimization_id)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._terminal_cache[optimization_id]
+            return None
+        self._terminal_cache.move_to_end(optimization_id)
+        return entry[1]
+
+    def _cache_item_if_terminal(self, optimization_id: str, item: Dict[str, Any]) -> None:
+        """Cache an item once its optimization has completed and will no longer be updated."""
+        if item.get('status') != 'completed' or item.get('current_step') != 'optimization_completed':
+            return
+        # The completion step is saved before the results, so an item read in between
+        # is still changing and must not be cached
+        if 'results' not in item:
+            return
+        self._terminal_cache[optimization_id] = (time.monotonic() + _TERMINAL_CACHE_TTL, item)
+        self._terminal_cache.move_to_end(optimization_id)
+        if len(self._terminal_cache) > _TERMINAL_CACHE_SIZE:
+            self._terminal_cache.popitem(last=False)
+
+    async def _get_item(self, optimization_id: str, progress_only: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Fetch an optimization item, serving finished optimizations from the cache.
+
+        Args:
+            optimization_id (str): Unique identifier for the optimization
+            progress_only (bool): Fetch only the progress attributes, skipping the results blob
+
+        Returns:
+            Optional[Dict[str, Any]]: The stored item, or None if not found
+        """
+        item = self._get_cached_item(optimization_id)
+        if item is not None:
+            logger.info("[CACHE] [ID:%s] Serving finished optimization from cache", optimization_id)
+            return item
+
+        # boto3 calls block, so they run in a worker thread to keep the event loop free
+        if progress_only:
+            response = await asyncio.to_thread(
+                self.client.get_item,
+                TableName=self.table_name,
+                Key={'optimization_id': {'S': optimization_id}},
+                ProjectionExpression=_PROGRESS_PROJECTION,
+                ExpressionAttributeNames={'#st': 'status'}
+            )
+            item = response.get('Item')
+            # Partial items are never cached, as the results reader needs the full item
+            return {name: _deserializer.deserialize(value) for name, value in item.items()} if item else None
+
+        response = await asyncio.to_thread(self.table.get_item, Key={'optimization_id': optimization_id})
+        item = response.get('Item')
+        if item is not None:
+            self._cache_item_if_terminal(optimization_id, item)
+        return item
+
     def ensure_table_exists(self) -> bool:
         """
         Ensure the DynamoDB table exists, create if it doesn't.
@@ -87,24 +218,30 @@ class DynamoDBStorage:
         if not self.enabled:
             return False
 
+        # The table does not go away at runtime, so it is only described once
+        if self._table_verified:
+            return True
+
         try:
-            table = self.dynamodb.Table(self.table_name)
+            table = self.table
 
             # Try to describe the table to check if it exists
             table.table_status
-            logger.info(f"[OK] DynamoDB table '{self.table_name}' exists")
+            logger.info("[OK] DynamoDB table '%s' exists", self.table_name)
+            self._table_verified = True
             return True
 
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceNotFoundException':
                 # Table doesn't exist, create it
-                logger.info(f"[CREATE] Creating DynamoDB table '{self.table_name}'...")
-                return self._create_table()
+                logger.info("[CREATE] Creating DynamoDB table '%s'...", self.table_name)
+                self._table_verified = self._create_table()
+                return self._table_verified
             else:
-                logger.error(f"[ERROR] Error checking table existence: {e}")
+                logger.error("[ERROR] Error checking table existence: %s", e)
                 return False
         except Exception as e:
-            logger.error(f"[CRITICAL] Unexpected error checking table: {e}")
+            logger.error("[CRITICAL] Unexpected error checking table: %s", e)
             return False
 
     def _create_table(self) -> bool:
@@ -127,6 +264,33 @@ class DynamoDBStorage:
                     {
                         'AttributeName': 'optimization_id',
                         'AttributeType': 'S'
+                    },
+                    {
+                        'AttributeName': 'status',
+                        'AttributeType': 'S'
+                    },
+                    {
+                        'AttributeName': 'created_at',
+                        'AttributeType': 'S'
+                    }
+                ],
+                GlobalSecondaryIndexes=[
+                    {
+                        'IndexName': _RECENT_INDEX_NAME,
+                        'KeySchema': [
+                            {
+                                'AttributeName': 'status',
+                                'KeyType': 'HASH'
+                            },
+                            {
+                                'AttributeName': 'created_at',
+                                'KeyType': 'RANGE'
+                            }
+                        ],
+                        'Projection': {
+                            'ProjectionType': 'INCLUDE',
+                            'NonKeyAttributes': ['profile_score', 'completeness_score']
+                        }
                     }
                 ],
                 BillingMode='PAY_PER_REQUEST',  # On-demand billing
@@ -143,24 +307,27 @@ class DynamoDBStorage:
             )
 
             # Wait for the table to be created
-            logger.info(f"[WAIT] Waiting for table '{self.table_name}' to be created...")
+            logger.info("[WAIT] Waiting for table '%s' to be created...", self.table_name)
             table.wait_until_exists()
 
-            logger.info(f"[OK] DynamoDB table '{self.table_name}' created successfully")
+            logger.info("[OK] DynamoDB table '%s' created successfully", self.table_name)
             return True
 
         except ClientError as e:
-            logger.error(f"[ERROR] Failed to create table: {e}")
+            logger.error("[ERROR] Failed to create table: %s", e)
             return False
         except Exception as e:
-            logger.error(f"[CRITICAL] Unexpected error creating table: {e}")
+            logger.error("[CRITICAL] Unexpected error creating table: %s", e)
             return False
 
     async def save_step_progress(self, optimization_id: str, step_name: str,
                                 step_data: Optional[Dict[str, Any]] = None,
                                 status: str = "processing") -> bool:
         """
-        Save individual step progress to DynamoDB.
+        Queue individual step progress to be saved to DynamoDB.
+
+        The write is performed by a background flusher so the workflow does not
+        wait on DynamoDB between steps; writes are applied in the order queued.
 
         Args:
             optimization_id (str): Unique identifier for the optimization
@@ -169,72 +336,142 @@ class DynamoDBStorage:
             status (str): Overall status ('processing', 'completed', 'failed')
 
         Returns:
-            bool: True if saved successfully
+            bool: True if queued successfully
         """
         if not self.enabled:
-            logger.error(f"[ERROR] DynamoDB is disabled. AWS credentials not configured.")
+            logger.error("[ERROR] DynamoDB is disabled. AWS credentials not configured.")
             return False
 
-        start_time = time.time()
-        logger.info(f"[WRITE] [ID:{optimization_id}] Saving step progress: {step_name}")
+        self._ensure_step_flusher()
+        completed_at = datetime.now(timezone.utc).isoformat()
+        self._step_queue.put_nowait((optimization_id, step_name, step_data, status, completed_at))
+        logger.info("[QUEUE] [ID:%s] Step progress queued: %s", optimization_id, step_name)
+        return True
+
+    def _ensure_step_flusher(self) -> None:
+        """Start the background step progress flusher on the running event loop if needed."""
+        if self._step_queue is None:
+            self._step_queue = asyncio.Queue()
+        # A restarted flusher picks up the existing queue, so writes still queued are not lost
+        if self._step_flusher is None or self._step_flusher.done():
+            self._step_flusher = asyncio.create_task(self._flush_step_progress())
+
+    async def _flush_step_progress(self) -> None:
+        """Write queued step progress to DynamoDB, one update at a time in queue order."""
+        while True:
+            item = await self._step_queue.get()
+            try:
+                await asyncio.to_thread(self._write_step_progress, *item)
+            finally:
+                self._step_queue.task_done()
 
-        try:
-            table = self.dynamodb.Table(self.table_name)
-            current_time = datetime.now(timezone.utc).isoformat()
+    async def flush_step_progress(self) -> None:
+        """
+        Wait for all queued step progress to be written, then stop the flusher.
 
-            # Get existing item or create new one
-            try:
-                response = table.get_item(Key={'optimization_id': optimization_id})
-                item = response.get('Item', {})
-            except ClientError:
-                item = {}
-
-            # Initialize progress tracking fields if they don't exist
-            if 'processing_steps' not in item:
-                item['processing_steps'] = []
-            if 'step_details' not in item:
-                item['step_details'] = {}
-
-            # Add completed step to list if not already there
-            completed_steps = item.get('processing_steps', [])
-            if step_name not in completed_steps:
-                completed_steps.append(step_name)
-
-            # Update step details (convert floats to Decimal)
-            step_details = item.get('step_details', {})
-            step_details[step_name] = {
+        Called on application shutdown so no progress update is lost.
+        """
+        if self._step_queue is None:
+            return
+        # Writes queued after the flusher stopped still need one to apply them
+        self._ensure_step_flusher()
+        await self._step_queue.join()
+        self._step_flusher.cancel()
+        self._step_flusher = None
+
+    def _write_step_progress(self, optimization_id: str, step_name: str,
+                             step_data: Optional[Dict[str, Any]], status: str,
+                             current_time: str) -> bool:
+        """
+        Write one step's progress to DynamoDB.
+
+        Args:
+            optimization_id (str): Unique identifier for the optimization
+            step_name (str): Name of the step
+            step_data (Optional[Dict[str, Any]]): Data specific to this step
+            status (str): Overall status ('processing', 'completed', 'failed')
+            current_time (str): ISO timestamp of when the step was reported
+
+        Returns:
+            bool: True if saved successfully
+        """
+        start_time = time.perf_counter()
+        logger.info("[WRITE] [ID:%s] Saving step progress: %s", optimization_id, step_name)
+
+        try:
+            # Step details (convert floats to Decimal)
+            details = {
                 'completed_at': current_time,
                 'data': convert_floats_to_decimal(step_data or {}),
                 'duration': Decimal(str(step_data.get('duration', 0))) if step_data and 'duration' in step_data else Decimal('0')
             }
 
-            # Update item (convert floats to Decimal)
-            item.update({
-                'optimization_id': optimization_id,
-                'processing_steps': completed_steps,
-                'current_step': step_name,
-                'status': status,
-                'step_details': step_details,
-                'updated_at': current_time,
-                'ttl': int(time.time()) + (30 * 24 * 60 * 60)  # 30 days TTL
-            })
+            # Fields set on every step, including created_at on the first one
+            common_set = "current_step = :step, #st = :status, updated_at = :now, created_at = if_not_exists(created_at, :now), #ttl = :ttl"
+            common_names = {'#st': 'status', '#ttl': 'ttl'}
+            common_values = {
+                ':step': step_name,
+                ':status': status,
+                ':now': current_time,
+                ':ttl': int(time.time()) + _TTL_SECONDS
+            }
 
-            # If this is the first step, also set created_at
-            if 'created_at' not in item:
-                item['created_at'] = current_time
+            # Update in place rather than reading and rewriting the whole item. The
+            # variants are tried in order; each one's condition selects the item state
+            # it applies to, so normally the first attempt succeeds in one round trip.
+            updates = (
+                # New step on an item that already tracks progress
+                (
+                    "SET #ps = list_append(#ps, :steps), #sd.#step = :details, " + common_set,
+                    "attribute_exists(#sd) AND NOT contains(#ps, :step)",
+                    {'#ps': 'processing_steps', '#sd': 'step_details', '#step': step_name},
+                    {':steps': [step_name], ':details': details}
+                ),
+                # Step saved again (e.g. success then failure): refresh its details only
+                (
+                    "SET #sd.#step = :details, " + common_set,
+                    "attribute_exists(#sd) AND contains(#ps, :step)",
+                    {'#ps': 'processing_steps', '#sd': 'step_details', '#step': step_name},
+                    {':details': details}
+                ),
+                # First step, or an item without progress tracking yet
+                (
+                    "SET #ps = list_append(if_not_exists(#ps, :empty), :steps), #sd = :step_details, " + common_set,
+                    "attribute_not_exists(#sd)",
+                    {'#ps': 'processing_steps', '#sd': 'step_details'},
+                    {':empty': [], ':steps': [step_name], ':step_details': {step_name: details}}
+                )
+            )
 
-            # Convert all floats in the entire item before saving
-            item = convert_floats_to_decimal(item)
+            for update_expression, condition, names, values in updates:
+                try:
+                    self.client.update_item(
+                        TableName=self.table_name,
+                        Key={'optimization_id': {'S': optimization_id}},
+                        UpdateExpression=update_expression,
+                        ConditionExpression=condition,
+                        ExpressionAttributeNames={**common_names, **names},
+                        ExpressionAttributeValues={
+                            name: _serializer.serialize(value)
+                            for name, value in {**common_values, **values}.items()
+                        }
+                    )
+                    break
+                except ClientError as e:
+                    if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                        raise
+            else:
+                raise RuntimeError("No step progress update matched the stored item")
 
-            table.put_item(Item=item)
+            self._terminal_cache.pop(optimization_id, None)
 
-            save_time = time.time() - start_time
-            logger.info(f"[OK] [ID:{optimization_id}] Step progress saved in {save_time:.2f}s")
+            save_time = time.perf_counter() - start_time
+            logger.info("[OK] [ID:%s] Step progress saved in %.2fs", optimization_id, save_time)
             return True
 
         except Exception as e:
-            save_time = time.time() - start_time
-            logger.error(f"[ERROR] [ID:{optimization_id}] Failed to save step progress after {save_time:.2f}s: {str(e)}")
+            save_time = time.perf_counter() - start_time
+            logger.error("[ERROR] [ID:%s] Failed to save step progress after %.2fs: %s", optimization_id, save_time, e)
             return False
 
     async def get_optimization_progress(self, optimization_id: str) -> Optional[Dict[str, Any]]:
@@ -250,22 +487,19 @@ class DynamoDBStorage:
         if not self.enabled:
             return None
 
-        start_time = time.time()
-        logger.info(f"[INFO] [ID:{optimization_id}] Retrieving optimization progress...")
+        start_time = time.perf_counter()
+        logger.info("[INFO] [ID:%s] Retrieving optimization progress...", optimization_id)
 
         try:
-            table = self.dynamodb.Table(self.table_name)
-
-            response = table.get_item(Key={'optimization_id': optimization_id})
+            item = await self._get_item(optimization_id, progress_only=True)
 
-            if 'Item' not in response:
-                retrieve_time = time.time() - start_time
-                logger.info(f"[INFO] [ID:{optimization_id}] Progress not found after {retrieve_time:.2f}s")
+            if item is None:
+                retrieve_time = time.perf_counter() - start_time
+                logger.info("[INFO] [ID:%s] Progress not found after %.2fs", optimization_id, retrieve_time)
                 return None
 
-            item = response['Item']
-            retrieve_time = time.time() - start_time
-            logger.info(f"[OK] [ID:{optimization_id}] Progress retrieved in {retrieve_time:.2f}s")
+            retrieve_time = time.perf_counter() - start_time
+            logger.info("[OK] [ID:%s] Progress retrieved in %.2fs", optimization_id, retrieve_time)
 
             # Return progress-specific data
             return {
@@ -275,14 +509,12 @@ class DynamoDBStorage:
                 'processing_steps': item.get('processing_steps', []),
                 'step_details': item.get('step_details', {}),
                 'created_at': item.get('created_at'),
-                'updated_at': item.get('updated_at'),
-                # Include results if available (for backwards compatibility)
-                'results': json.loads(item.get('results', '{}')) if item.get('results') else None
+                'updated_at': item.get('updated_at')
             }
 
         except Exception as e:
-            retrieve_time = time.time() - start_time
-            logger.error(f"[ERROR] [ID:{optimization_id}] Failed to get progress after {retrieve_time:.2f}s: {str(e)}")
+            retrieve_time = time.perf_counter() - start_time
+            logger.error("[ERROR] [ID:%s] Failed to get progress after %.2fs: %s", optimization_id, retrieve_time, e)
             return None
 
     async def save_optimization_result(self, optimization_id: str, results: Dict[str, Any],
@@ -301,53 +533,69 @@ class DynamoDBStorage:
         if not self.enabled:
             return False
 
-        start_time = time.time()
-        logger.info(f"[SAVE] [ID:{optimization_id}] Saving optimization results to DynamoDB...")
+        start_time = time.perf_counter()
+        logger.info("[SAVE] [ID:%s] Saving optimization results to DynamoDB...", optimization_id)
 
         try:
-            table = self.dynamodb.Table(self.table_name)
+            table = self.table
 
-            # Prepare item for storage
+            # Prepare attributes for storage
             current_time = datetime.now(timezone.utc).isoformat()
 
-            item = {
-                'optimization_id': optimization_id,
-                'results': json.dumps(results, default=str),  # Serialize complex objects
-                'created_at': current_time,
+            attributes = {
+                # Serialize complex objects and compress, keeping large results well under the 400KB item limit
+                'results': zlib.compress(orjson.dumps(results, default=str, option=orjson.OPT_NON_STR_KEYS)),
+                'results_codec': _RESULTS_CODEC,
                 'updated_at': current_time,
                 'status': 'completed' if results.get('success') else 'failed',
-                'ttl': int(time.time()) + (30 * 24 * 60 * 60)  # 30 days TTL
+                'ttl': int(time.time()) + _TTL_SECONDS
             }
 
             # Add metadata if provided
             if request_metadata:
-                item['metadata'] = json.dumps(request_metadata, default=str)
+                attributes['metadata'] = orjson.dumps(request_metadata, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
             # Add result summary for easy querying
             if results.get('success'):
                 summary = results.get('summary', {})
-                item['profile_score'] = summary.get('optimization_score', 0)
-                item['completeness_score'] = summary.get('profile_completeness', 0)
-                item['recommendations_count'] = len(summary.get('key_improvements', []))
-                item['content_ideas_count'] = len(results.get('content_results', {}).get('content_ideas', []))
+                attributes['profile_score'] = summary.get('optimization_score', 0)
+                attributes['completeness_score'] = summary.get('profile_completeness', 0)
+                attributes['recommendations_count'] = len(summary.get('key_improvements', []))
+                attributes['content_ideas_count'] = len(results.get('content_results', {}).get('content_ideas', []))
 
             # Convert all floats to Decimal before saving
-            item = convert_floats_to_decimal(item)
+            attributes = convert_floats_to_decimal(attributes)
+
+            # Update only the result fields so the step progress already stored on the item is kept;
+            # every attribute name goes through a placeholder since several are reserved words
+            names = {f"#a{i}": name for i, name in enumerate(attributes)}
+            values = {f":a{i}": value for i, value in enumerate(attributes.values())}
+            values[':now'] = current_time
+            update_expression = "SET " + ", ".join(f"#a{i} = :a{i}" for i in range(len(attributes)))
+            update_expression += ", created_at = if_not_exists(created_at, :now)"
 
             # Save to DynamoDB
-            table.put_item(Item=item)
+            await asyncio.to_thread(
+                table.update_item,
+                Key={'optimization_id': optimization_id},
+                UpdateExpression=update_expression,
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+                ReturnValues='NONE'
+            )
+            self._terminal_cache.pop(optimization_id, None)
 
-            save_time = time.time() - start_time
-            logger.info(f"[OK] [ID:{optimization_id}] Results saved to DynamoDB in {save_time:.2f}s")
+            save_time = time.perf_counter() - start_time
+            logger.info("[OK] [ID:%s] Results saved to DynamoDB in %.2fs", optimization_id, save_time)
             return True
 
         except ClientError as e:
-            save_time = time.time() - start_time
-            logger.error(f"[ERROR] [ID:{optimization_id}] DynamoDB save failed after {save_time:.2f}s: {e}")
+            save_time = time.perf_counter() - start_time
+            logger.error("[ERROR] [ID:%s] DynamoDB save failed after %.2fs: %s", optimization_id, save_time, e)
             return False
         except Exception as e:
-            save_time = time.time() - start_time
-            logger.error(f"[CRITICAL] [ID:{optimization_id}] Unexpected save error after {save_time:.2f}s: {e}")
+            save_time = time.perf_counter() - start_time
+            logger.error("[CRITICAL] [ID:%s] Unexpected save error after %.2fs: %s", optimization_id, save_time, e)
             return False
 
     async def get_optimization_result(self, optimization_id: str) -> Optional[Dict[str, Any]]:
@@ -363,26 +611,21 @@ class DynamoDBStorage:
         if not self.enabled:
             return None
 
-        start_time = time.time()
-        logger.info(f"[INFO] [ID:{optimization_id}] Retrieving optimization results from DynamoDB...")
+        start_time = time.perf_counter()
+        logger.info("[INFO] [ID:%s] Retrieving optimization results from DynamoDB...", optimization_id)
 
         try:
-            table = self.dynamodb.Table(self.table_name)
-
             # Get item from DynamoDB
-            response = table.get_item(
-                Key={'optimization_id': optimization_id}
-            )
+            item = await self._get_item(optimization_id)
 
-            if 'Item' not in response:
-                retrieve_time = time.time() - start_time
-                logger.warning(f"[NOTFOUND] [ID:{optimization_id}] No results found after {retrieve_time:.2f}s")
+            # Items of optimizations still in progress carry step progress but no results yet
+            if item is None or 'results' not in item:
+                retrieve_time = time.perf_counter() - start_time
+                logger.warning("[NOTFOUND] [ID:%s] No results found after %.2fs", optimization_id, retrieve_time)
                 return None
 
-            item = response['Item']
-
             # Parse the stored results
-            results = json.loads(item['results'])
+            results = _load_results(item)
 
             # Add metadata about storage
             results['storage_info'] = {
@@ -394,54 +637,55 @@ class DynamoDBStorage:
 
             # Add metadata if available
             if 'metadata' in item:
-                results['request_metadata'] = json.loads(item['metadata'])
+                results['request_metadata'] = orjson.loads(item['metadata'])
 
-            retrieve_time = time.time() - start_time
-            logger.info(f"[OK] [ID:{optimization_id}] Results retrieved from DynamoDB in {retrieve_time:.2f}s")
+            retrieve_time = time.perf_counter() - start_time
+            logger.info("[OK] [ID:%s] Results retrieved from DynamoDB in %.2fs", optimization_id, retrieve_time)
             return results
 
         except ClientError as e:
-            retrieve_time = time.time() - start_time
-            logger.error(f"[ERROR] [ID:{optimization_id}] DynamoDB retrieval failed after {retrieve_time:.2f}s: {e}")
+            retrieve_time = time.perf_counter() - start_time
+            logger.error("[ERROR] [ID:%s] DynamoDB retrieval failed after %.2fs: %s", optimization_id, retrieve_time, e)
             return None
         except Exception as e:
-            retrieve_time = time.time() - start_time
-            logger.error(f"[CRITICAL] [ID:{optimization_id}] Unexpected retrieval error after {retrieve_time:.2f}s: {e}")
+            retrieve_time = time.perf_counter() - start_time
+            logger.error("[CRITICAL] [ID:%s] Unexpected retrieval error after %.2fs: %s", optimization_id, retrieve_time, e)
             return None
 
     async def list_recent_optimizations(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
-        List recent optimization results (requires GSI on created_at).
+        List recent completed optimization results (requires the status/created_at GSI).
 
         Args:
             limit (int): Maximum number of results to return
 
         Returns:
-            List[Dict[str, Any]]: List of recent optimization summaries
+            List[Dict[str, Any]]: List of recent optimization summaries, newest first
         """
         if not self.enabled:
             return []
 
         try:
-            table = self.dynamodb.Table(self.table_name)
+            table = self.table
 
-            # Note: This is a simple scan - in production, you'd want a GSI on created_at
-            response = table.scan(
+            # Query the GSI newest-first so only `limit` items are read
+            response = await asyncio.to_thread(
+                table.query,
+                IndexName=_RECENT_INDEX_NAME,
+                KeyConditionExpression=Key('status').eq('completed'),
                 ProjectionExpression='optimization_id, created_at, #status, profile_score, completeness_score',
                 ExpressionAttributeNames={'#status': 'status'},
+                ScanIndexForward=False,
                 Limit=limit
             )
 
             items = response.get('Items', [])
 
-            # Sort by created_at (newest first)
-            items.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-
-            logger.info(f"[LIST] Retrieved {len(items)} recent optimization results")
-            return items[:limit]
+            logger.info("[LIST] Retrieved %s recent optimization results", len(items))
+            return items
 
         except Exception as e:
-            logger.error(f"[ERROR] Failed to list recent optimizations: {e}")
+            logger.error("[ERROR] Failed to list recent optimizations: %s", e)
             return []
 
     async def delete_optimization_result(self, optimization_id: str) -> bool:
@@ -458,17 +702,19 @@ class DynamoDBStorage:
             return False
 
         try:
-            table = self.dynamodb.Table(self.table_name)
+            table = self.table
 
-            table.delete_item(
+            await asyncio.to_thread(
+                table.delete_item,
                 Key={'optimization_id': optimization_id}
             )
+            self._terminal_cache.pop(optimization_id, None)
 
-            logger.info(f"[DELETE] [ID:{optimization_id}] Results deleted from DynamoDB")
+            logger.info("[DELETE] [ID:%s] Results deleted from DynamoDB", optimization_id)
             return True
 
         except Exception as e:
-            logger.error(f"[ERROR] [ID:{optimization_id}] Failed to delete results: {e}")
+            logger.error("[ERROR] [ID:%s] Failed to delete results: %s", optimization_id, e)
             return False
 
 
@@ -0,0 +1,111 @@
+"""
+Streaming JSON helpers for LinkedIn Profile Optimizer.
+
+This module parses JSON objects streamed from the LLM section by section, so
+decoding overlaps with generation instead of running after the last token.
+"""
+
+from typing import Any, List, Tuple
+import orjson
+
+_WHITESPACE = " \t\r\n"
+
+
+class SectionStreamParser:
+    """
+    Incrementally split a streamed JSON object into its top-level members.
+
+    Tracks string/escape state and nesting depth across chunks, and parses each
+    top-level value as soon as the delimiter that ends it arrives. Each chunk is
+    scanned once; only the text of the member in progress is kept joinable, so
+    the work stays linear in the length of the stream.
+    """
+
+    def __init__(self):
+        self.complete = False
+        self._chunks: List[str] = []
+        self._length = 0
+        # Chunks covering the text from _pending_start on, i.e. the member in progress
+        self._pending: List[str] = []
+        self._pending_start = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key_start = None
+        self._key = None
+        self._value_start = None
+
+    @property
+    def text(self) -> str:
+        """Full text received so far."""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Consume a chunk of text and return any top-level members it completed.
+
+        Raises:
+            orjson.JSONDecodeError: If the top-level value is not a JSON object
+        """
+        self._chunks.append(chunk)
+        self._pending.append(chunk)
+        base = self._length
+        self._length += len(chunk)
+        completed = []
+
+        for offset, char in enumerate(chunk):
+            i = base + offset
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._value_start is None:
+                        self._key = orjson.loads(self._slice(self._key_start, i + 1))
+                continue
+
+            if not self._started:
+                if char in _WHITESPACE:
+                    continue
+                if char != "{":
+                    raise orjson.JSONDecodeError("Expected a JSON object at the top level", self.text, i)
+                self._started = True
+
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._value_start is None:
+                    self._key_start = i
+            elif char == ":" and self._depth == 1 and self._value_start is None:
+                self._value_start = i + 1
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._complete_member(i, completed)
+                    self.complete = True
+            elif char == "," and self._depth == 1:
+                self._complete_member(i, completed)
+
+        return completed
+
+    def _slice(self, start: int, stop: int) -> str:
+        """Return the received text in [start, stop), which must lie within the member in progress."""
+        region = "".join(self._pending)
+        self._pending = [region]
+        return region[start - self._pending_start:stop - self._pending_start]
+
+    def _complete_member(self, end: int, completed: List[Tuple[str, Any]]) -> None:
+        """Parse the top-level value ending at `end`, record it, and drop the text before the delimiter."""
+        if self._value_start is not None:
+            completed.append((self._key, orjson.loads(self._slice(self._value_start, end))))
+            self._key = None
+            self._value_start = None
+
+        region = "".join(self._pending)
+        self._pending = [region[end + 1 - self._pending_start:]]
+        self._pending_start = end + 1
@@ -0,0 +1,132 @@
+"""
+Shared LLM clients for LinkedIn Profile Optimizer.
+
+This module owns the HTTP connection pool and the cached ChatOpenAI clients
+used by every agent, so all OpenAI traffic reuses the same connections.
+"""
+
+import hashlib
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict
+import httpx
+
+# langchain and openai are imported lazily to keep worker cold-start fast
+if TYPE_CHECKING:
+    from langchain_core.messages import AIMessage, AIMessageChunk
+    from langchain_openai import ChatOpenAI
+    from openai import AsyncOpenAI
+
+from config import config
+
+# Shared defaults for responses that carry no usage metadata
+_EMPTY_TOKEN_USAGE = {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0}
+_EMPTY_USAGE_METADATA = {'input_tokens': 0, 'output_tokens': 0, 'total_tokens': 0}
+
+# Shared HTTP/2 connection pool so agents multiplex requests over keep-alive TLS connections to OpenAI
+_SHARED_HTTP_CLIENT = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=256, max_keepalive_connections=64, keepalive_expiry=60),
+    timeout=httpx.Timeout(600.0, connect=10.0)
+)
+
+
+@lru_cache(maxsize=32)
+def get_llm(model_name: str, api_key: str) -> "ChatOpenAI":
+    """
+    Return a cached JSON-mode ChatOpenAI client for the given model and API key.
+
+    Args:
+        model_name (str): OpenAI model name
+        api_key (str): OpenAI API key
+
+    Returns:
+        ChatOpenAI: Client bound to the shared HTTP connection pool
+    """
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(
+        model=model_name,
+        temperature=config.DEFAULT_TEMPERATURE,
+        # max_completion_tokens=config.MAX_TOKENS,
+        openai_api_key=api_key,
+        http_async_client=_SHARED_HTTP_CLIENT,
+        # JSON mode guarantees a bare JSON object, with no markdown fences to strip
+        model_kwargs={"response_format": {"type": "json_object"}}
+    )
+
+
+def cache_scope(model_name: str, api_key: str) -> str:
+    """
+    Digest of the model and API key that scopes cached LLM results.
+
+    Cached results never cross API keys, matching the API-level result cache.
+
+    Args:
+        model_name (str): OpenAI model name
+        api_key (str): OpenAI API key
+
+    Returns:
+        str: Hex digest to include in cache keys
+    """
+    return hashlib.blake2b(f"{model_name}\0{api_key}".encode(), digest_size=16).hexdigest()
+
+
+def get_openai_client(api_key: str) -> "AsyncOpenAI":
+    """Return a raw OpenAI client bound to the shared HTTP connection pool."""
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=api_key, http_client=_SHARED_HTTP_CLIENT)
+
+
+def build_messages(system_prompt: str, user_prompt: str) -> list:
+    """Build the system/user message pair sent to the LLM."""
+    from langchain.schema import HumanMessage, SystemMessage
+
+    return [
+        SystemMessage(content=system_prompt),
+        HumanMessage(content=user_prompt)
+    ]
+
+
+def get_token_usage(response: "AIMessage") -> Dict[str, Any]:
+    """
+    Extract token usage from a completed (non-streamed) LLM response.
+
+    Args:
+        response (AIMessage): Response returned by ainvoke/abatch
+
+    Returns:
+        Dict[str, Any]: Model name and prompt/completion/total token counts
+    """
+    usage = response.response_metadata.get('token_usage') or _EMPTY_TOKEN_USAGE
+    return {
+        'model': config.OPENAI_MODEL,
+        'prompt_tokens': usage.get('prompt_tokens', 0),
+        'completion_tokens': usage.get('completion_tokens', 0),
+        'total_tokens': usage.get('total_tokens', 0)
+    }
+
+
+def get_stream_token_usage(aggregate: "AIMessageChunk | None") -> Dict[str, Any]:
+    """
+    Extract token usage from the aggregate of a streamed LLM response.
+
+    Args:
+        aggregate (AIMessageChunk | None): Sum of all streamed chunks, or None if nothing arrived
+
+    Returns:
+        Dict[str, Any]: Model name and prompt/completion/total token counts
+    """
+    usage = (aggregate.usage_metadata if aggregate is not None else None) or _EMPTY_USAGE_METADATA
+    return {
+        'model': config.OPENAI_MODEL,
+        'prompt_tokens': usage.get('input_tokens', 0),
+        'completion_tokens': usage.get('output_tokens', 0),
+        'total_tokens': usage.get('total_tokens', 0)
+    }
+
+
+async def close_llm_clients() -> None:
+    """Close the shared HTTP connection pool used by all agents."""
+    get_llm.cache_clear()
+    await _SHARED_HTTP_CLIENT.aclose()
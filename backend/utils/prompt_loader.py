@@ -1,25 +1,142 @@
+import hashlib
+import json
+import os
+import tempfile
 import yaml
-from typing import Dict, Any
+from stat import S_ISDIR
+from typing import Callable, Dict, Any, Tuple
 from pathlib import Path
 
+# libyaml's C parser when available; the pure-Python loader otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def _user_cache_dir() -> Path:
+    """Return the per-user cache directory: $XDG_CACHE_HOME if set to an absolute path, else ~/.cache."""
+    base = os.environ.get("XDG_CACHE_HOME", "")
+    if not os.path.isabs(base):
+        base = os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base)
+
+
+# Parsed prompts per file, with the (mtime_ns, size) they were parsed at, shared process-wide
+_PROMPT_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
+# Directory holding the JSON copies of parsed prompt files, outside the source tree. It is
+# per-user rather than in the shared temp directory, where anyone could plant prompts
+_JSON_CACHE_DIR = _user_cache_dir() / "linkedin-optimizer-prompts"
+
+
+def _is_private_dir(directory: Path) -> bool:
+    """
+    Create a cache directory owner-only if missing and check that no one else can write to it.
+
+    Args:
+        directory (Path): Cache directory to check
+
+    Returns:
+        bool: True if the directory is a real directory owned by this user and not group/world writable
+    """
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = directory.lstat()
+    except OSError:
+        return False
+    return S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and not st.st_mode & 0o022
+
 
 class PromptLoader:
     """Utility class for loading and managing prompts from YAML files."""
 
+    # Process-wide loader per prompts file, handed out by get_shared()
+    _shared: Dict[str, "PromptLoader"] = {}
+
     def __init__(self, prompts_file: str = "prompts.yaml"):
         self.prompts_file = Path(__file__).parent.parent / prompts_file
         self.prompts = self._load_prompts()
+        self._user_prompt_formatters = self._compile_user_prompts()
+
+    @classmethod
+    def get_shared(cls, prompts_file: str = "prompts.yaml") -> "PromptLoader":
+        """Return the process-wide loader for a prompts file, creating it on first use."""
+        loader = cls._shared.get(prompts_file)
+        if loader is None:
+            loader = cls._shared[prompts_file] = cls(prompts_file)
+        return loader
 
     def _load_prompts(self) -> Dict[str, Any]:
-        """Load prompts from YAML file."""
+        """
+        Load prompts from YAML file.
+
+        Parsed prompts are shared process-wide until the file's mtime or size changes.
+        A JSON copy is kept in a private per-user cache directory and used while it records
+        exactly the YAML file's current mtime and size, since parsing JSON is far cheaper than YAML.
+        """
         try:
-            with open(self.prompts_file, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
+            stat = self.prompts_file.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompts file not found: {self.prompts_file}")
+
+        source = (stat.st_mtime_ns, stat.st_size)
+        cached = _PROMPT_CACHE.get(self.prompts_file)
+        if cached is not None and cached[:2] == source:
+            return cached[2]
+
+        prompts = self._parse_prompts(self._json_copy_path(), source)
+        _PROMPT_CACHE[self.prompts_file] = (*source, prompts)
+        return prompts
+
+    def _json_copy_path(self) -> Path:
+        """Return the cache path of this prompts file's JSON copy, unique per source path."""
+        digest = hashlib.blake2b(str(self.prompts_file.resolve()).encode(), digest_size=8).hexdigest()
+        return _JSON_CACHE_DIR / f"{self.prompts_file.stem}-{digest}.json"
+
+    def _parse_prompts(self, json_file: Path, source: Tuple[int, int]) -> Dict[str, Any]:
+        """Parse the prompts from the JSON copy if it was made from this exact YAML file, otherwise from the YAML."""
+        # A copy in a directory others can write to could have been planted, so it is neither read nor written
+        use_copy = _is_private_dir(json_file.parent)
+        if use_copy:
+            try:
+                copy = json.loads(json_file.read_bytes())
+                if (copy["source_mtime_ns"], copy["source_size"]) == source:
+                    return copy["prompts"]
+            except (OSError, ValueError, KeyError, TypeError):
+                pass  # No usable JSON copy: fall back to the YAML source
+
+        try:
+            # Read raw bytes: libyaml decodes UTF-8 itself
+            prompts = yaml.load(self.prompts_file.read_bytes(), Loader=_YamlLoader)
         except FileNotFoundError:
             raise FileNotFoundError(f"Prompts file not found: {self.prompts_file}")
         except yaml.YAMLError as e:
             raise Exception(f"Error parsing prompts YAML: {str(e)}")
 
+        if use_copy:
+            self._write_json_copy(json_file, {
+                "source_mtime_ns": source[0],
+                "source_size": source[1],
+                "prompts": prompts
+            })
+        return prompts
+
+    @staticmethod
+    def _write_json_copy(json_file: Path, copy: Dict[str, Any]) -> None:
+        """Atomically write the JSON copy of the prompts, skipping it where the cache directory is unwritable."""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=json_file.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                    json.dump(copy, file, ensure_ascii=False)
+                os.replace(tmp_path, json_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
     def get_system_prompt(self, agent_name: str) -> str:
         """Get system prompt for a specific agent."""
         try:
@@ -34,11 +151,22 @@ class PromptLoader:
         except KeyError:
             raise KeyError(f"User prompt not found for agent: {agent_name}")
 
+    def _compile_user_prompts(self) -> Dict[str, Callable[..., str]]:
+        """Bind each agent's user prompt template to its format method once, for format_user_prompt."""
+        return {
+            agent_name: section["user_prompt"].format
+            for agent_name, section in self.prompts.items()
+            if isinstance(section, dict) and "user_prompt" in section
+        }
+
     def format_user_prompt(self, agent_name: str, **kwargs) -> str:
         """Format user prompt with provided parameters."""
-        template = self.get_user_prompt(agent_name)
         try:
-            return template.format(**kwargs)
+            formatter = self._user_prompt_formatters[agent_name]
+        except KeyError:
+            raise KeyError(f"User prompt not found for agent: {agent_name}")
+        try:
+            return formatter(**kwargs)
         except KeyError as e:
             raise KeyError(f"Missing parameter for prompt formatting: {str(e)}")
 
@@ -48,4 +176,5 @@ class PromptLoader:
 
     def reload_prompts(self):
         """Reload prompts from file."""
-        self.prompts = self._load_prompts()
\ No newline at end of file
+        self.prompts = self._load_prompts()
+        self._user_prompt_formatters = self._compile_user_prompts()
\ No newline at end of file
@@ -1,9 +1,11 @@
 import asyncio
 import logging
+import os
+import re
 import time
-from typing import Dict, Any, Optional, TypedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Dict, Optional, Tuple, TypedDict, TypeVar
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
 
 from agents.profile_collector import ProfileCollectorAgent
 from agents.profile_analyzer import ProfileAnalyzerAgent
@@ -13,11 +15,109 @@ from config import config
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+# Agents hold no per-request state, so one instance per API key is shared across
+# requests instead of re-loading the prompts file on every workflow step
+@lru_cache(maxsize=32)
+def get_profile_collector(api_key: Optional[str]) -> ProfileCollectorAgent:
+    """Return the shared ProfileCollectorAgent for an API key."""
+    return ProfileCollectorAgent(api_key=api_key)
+
+
+@lru_cache(maxsize=32)
+def get_profile_analyzer(api_key: Optional[str]) -> ProfileAnalyzerAgent:
+    """Return the shared ProfileAnalyzerAgent for an API key."""
+    return ProfileAnalyzerAgent(api_key=api_key)
+
+
+@lru_cache(maxsize=32)
+def get_content_generator(api_key: Optional[str]) -> ContentGeneratorAgent:
+    """Return the shared ContentGeneratorAgent for an API key."""
+    return ContentGeneratorAgent(api_key=api_key)
+
+
+# Profile sections counted towards completeness, each with the check for a filled-in section
+_SECTION_RULES = (
+    ("personal_info", lambda data: bool(data and data.get("name") and data.get("title"))),
+    ("summary", lambda data: bool(data and data.strip())),
+    ("experience", bool),
+    ("education", bool),
+    ("skills", bool),
+    ("certifications", bool),
+    ("recommendations", bool),
+)
+
+
+# Token counts summed across the agents' usage reports
+_TOKEN_USAGE_FIELDS = ('prompt_tokens', 'completion_tokens', 'total_tokens')
+
+
+# Error fragments marking failures that retrying later steps cannot recover from,
+# matched in a single regex scan of the lowercased error message
+_CRITICAL_ERROR_KEYWORDS = (
+    "api key",
+    "authentication",
+    "unauthorized",
+    "invalid_api_key",
+    "invalid_request_error",
+    "rate_limit",
+    "quota_exceeded",
+    "insufficient_quota",
+    "billing",
+    "permission denied",
+    "forbidden"
+)
+_CRITICAL_ERROR_RE = re.compile("|".join(map(re.escape, _CRITICAL_ERROR_KEYWORDS)))
+
+
+def _classify_error(error_msg: str) -> Tuple[bool, str]:
+    """
+    Classify a workflow error and pick the message to show the user.
+
+    Args:
+        error_msg (str): Error recorded in the workflow state
+
+    Returns:
+        Tuple[bool, str]: Whether the error is critical, and the user-facing message
+    """
+    error_lower = error_msg.lower()
+    if not _CRITICAL_ERROR_RE.search(error_lower):
+        return False, error_msg
+
+    # Provide user-friendly error message for critical errors
+    if "api key" in error_lower or "authentication" in error_lower:
+        return True, "Invalid or missing OpenAI API key. Please check your API key and try again."
+    if "rate_limit" in error_lower or "quota" in error_lower:
+        return True, "API rate limit or quota exceeded. Please try again later or check your OpenAI account."
+    if "billing" in error_lower:
+        return True, "OpenAI billing issue. Please check your OpenAI account billing status."
+    return True, "Authentication or permission error. Please check your OpenAI API key."
+
+
+async def _with_step_timeout(awaitable: Awaitable[T], step_label: str) -> T:
+    """
+    Await a step's agent work, failing the step if it exceeds the configured timeout.
+
+    Args:
+        awaitable (Awaitable[T]): Agent call(s) making up the step
+        step_label (str): Step name used in the timeout error
+
+    Returns:
+        T: Result of the awaited work
+    """
+    try:
+        return await asyncio.wait_for(awaitable, timeout=config.STEP_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"{step_label} timed out after {config.STEP_TIMEOUT_SECONDS:.0f}s") from None
+
 
 class WorkflowState(TypedDict):
     """State object for the LinkedIn Profile Optimizer workflow."""
     pdf_path: Optional[str]
     pdf_bytes: Optional[bytes]
+    pdf_size: int
     target_role: Optional[str]
     profile_data: Optional[Dict[str, Any]]
     analysis_results: Optional[Dict[str, Any]]
@@ -30,6 +130,26 @@ class WorkflowState(TypedDict):
     step_timings: Optional[Dict[str, float]]
 
 
+class StepTimer:
+    """Times one workflow step and records its duration in the state's step_timings."""
+
+    def __init__(self, state: WorkflowState, step_name: str):
+        self.step_timings = state["step_timings"]
+        self.step_name = step_name
+        self.start = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the step started."""
+        return time.perf_counter() - self.start
+
+    def record(self) -> float:
+        """Store the elapsed time under the step name and return it."""
+        elapsed = self.elapsed
+        self.step_timings[self.step_name] = elapsed
+        return elapsed
+
+
 class LinkedInOptimizerWorkflow:
     """LangGraph workflow orchestrating the LinkedIn Profile Optimizer agents."""
 
@@ -41,6 +161,8 @@ class LinkedInOptimizerWorkflow:
             api_key: Optional OpenAI API key to use (overrides config)
         """
         self.api_key = api_key
+        # Storage availability is decided once at startup from the AWS configuration
+        self._storage_enabled = storage.is_enabled()
         self.workflow = self._build_workflow()
 
     def _build_workflow(self) -> StateGraph:
@@ -82,7 +204,21 @@ class LinkedInOptimizerWorkflow:
         workflow.add_edge("generate_content", "compile_results")
         workflow.add_edge("compile_results", END)
 
-        return workflow.compile(checkpointer=MemorySaver())
+        # Each run is a single-shot invocation whose state nobody resumes or inspects,
+        # so no checkpointer: it would snapshot the full state after every node and
+        # keep every run's snapshots in memory for the life of the process
+        return workflow.compile()
+
+    async def _save_progress(self, **kwargs: Any) -> bool:
+        """
+        Save step progress, skipping the storage call entirely when storage is disabled.
+
+        Returns:
+            bool: True if the progress was queued or there is no storage to save to
+        """
+        if not self._storage_enabled:
+            return True
+        return await storage.save_step_progress(**kwargs)
 
     def _should_continue(self, state: WorkflowState) -> str:
         """
@@ -99,23 +235,7 @@ class LinkedInOptimizerWorkflow:
         if not error:
             return "continue"
 
-        # Check for critical error indicators
-        critical_keywords = [
-            "api key",
-            "authentication",
-            "unauthorized",
-            "invalid_api_key",
-            "invalid_request_error",
-            "rate_limit",
-            "quota_exceeded",
-            "insufficient_quota",
-            "billing",
-            "permission denied",
-            "forbidden"
-        ]
-
-        error_lower = error.lower()
-        is_critical = any(keyword in error_lower for keyword in critical_keywords)
+        is_critical, _ = _classify_error(error)
 
         if is_critical:
             request_id = state.get("request_id", "unknown")
@@ -130,42 +250,72 @@ class LinkedInOptimizerWorkflow:
         """Node for collecting profile data from PDF."""
         request_id = state.get("request_id", "unknown")
         api_key = state.get("api_key") or self.api_key
-        step_start = time.time()
+        timer = StepTimer(state, "profile_collection")
 
         logger.info(f"[INFO] [REQ:{request_id}] Starting Profile Collector Agent...")
 
         try:
             state["status"] = "Extracting profile data from PDF..."
 
-            # Initialize agent with API key
-            profile_collector = ProfileCollectorAgent(api_key=api_key)
+            # Get the shared agent for this API key
+            profile_collector = get_profile_collector(api_key)
 
+            # PyMuPDF parsing is synchronous CPU work, so it runs in a worker thread
+            # to keep the event loop serving other requests meanwhile
             if state.get("pdf_bytes"):
                 logger.info(f"[INFO] [REQ:{request_id}] Processing PDF from bytes ({len(state['pdf_bytes'])} bytes)")
-                profile_data = await profile_collector.extract_profile_data_from_bytes(
-                    state["pdf_bytes"], request_id
-                )
+                try:
+                    pdf_content = await asyncio.to_thread(
+                        profile_collector.extract_text_from_bytes, state["pdf_bytes"], request_id
+                    )
+                except Exception as e:
+                    raise Exception(f"Error extracting profile data from bytes: {str(e)}")
             elif state.get("pdf_path"):
                 logger.info(f"[INFO] [REQ:{request_id}] Processing PDF from path: {state['pdf_path']}")
-                profile_data = await profile_collector.extract_profile_data(
-                    state["pdf_path"], request_id
-                )
+                try:
+                    pdf_content = await asyncio.to_thread(
+                        profile_collector.extract_text_from_path, state["pdf_path"], request_id
+                    )
+                except Exception as e:
+                    raise Exception(f"Error extracting profile data from file: {str(e)}")
             else:
                 raise ValueError("No PDF data provided (neither path nor bytes)")
 
+            # Only the extracted text is needed from here on; pdf_size already holds the
+            # file size for the stored metadata, so release the PDF buffer from state
+            state["pdf_bytes"] = None
+
+            # Analyze the raw PDF text concurrently with structured extraction
+            profile_analyzer = get_profile_analyzer(api_key)
+            profile_data, analysis_results = await _with_step_timeout(
+                asyncio.gather(
+                    profile_collector.extract_profile_data_from_text(pdf_content, request_id),
+                    profile_analyzer.analyze_profile(
+                        None, state.get("target_role"), request_id, pdf_content=pdf_content
+                    ),
+                    return_exceptions=True
+                ),
+                "Profile collection"
+            )
+
+            if isinstance(profile_data, BaseException):
+                raise profile_data
+
+            if isinstance(analysis_results, BaseException):
+                logger.warning(f"[WARN] [REQ:{request_id}] Concurrent profile analysis failed, will retry after collection: {str(analysis_results)}")
+            else:
+                state["analysis_results"] = analysis_results
+
             state["profile_data"] = profile_data
             state["status"] = "Profile data extracted successfully"
 
-            step_time = time.time() - step_start
-            if not state.get("step_timings"):
-                state["step_timings"] = {}
-            state["step_timings"]["profile_collection"] = step_time
+            step_time = timer.record()
 
             logger.info(f"[OK] [REQ:{request_id}] Profile collection completed in {step_time:.2f}s")
             logger.info(f"[INFO] [REQ:{request_id}] Extracted sections: {list(profile_data.keys())}")
 
             # Save step progress immediately
-            progress_saved = await storage.save_step_progress(
+            progress_saved = await self._save_progress(
                 optimization_id=request_id,
                 step_name="profile_extraction",
                 step_data={
@@ -180,13 +330,13 @@ class LinkedInOptimizerWorkflow:
                 logger.warning(f"[WARN] [REQ:{request_id}] Failed to save profile_extraction progress to DynamoDB")
 
         except Exception as e:
-            step_time = time.time() - step_start
+            step_time = timer.elapsed
             state["error"] = f"Error in profile collection: {str(e)}"
             state["status"] = "Failed to extract profile data"
             logger.error(f"[ERROR] [REQ:{request_id}] Profile collection failed after {step_time:.2f}s: {str(e)}")
 
             # Save failed status to DynamoDB
-            await storage.save_step_progress(
+            await self._save_progress(
                 optimization_id=request_id,
                 step_name="profile_extraction",
                 step_data={
@@ -202,7 +352,7 @@ class LinkedInOptimizerWorkflow:
         """Node for analyzing profile data."""
         request_id = state.get("request_id", "unknown")
         api_key = state.get("api_key") or self.api_key
-        step_start = time.time()
+        timer = StepTimer(state, "profile_analysis")
 
         logger.info(f"[INFO] [REQ:{request_id}] Starting Profile Analyzer Agent...")
 
@@ -216,30 +366,35 @@ class LinkedInOptimizerWorkflow:
             if not state.get("profile_data"):
                 raise ValueError("No profile data available for analysis")
 
-            logger.info(f"[INFO] [REQ:{request_id}] Analyzing profile for target role: {state.get('target_role', 'General')}")
+            analysis_results = state.get("analysis_results")
 
-            # Initialize agent with API key
-            profile_analyzer = ProfileAnalyzerAgent(api_key=api_key)
-
-            analysis_results = await profile_analyzer.analyze_profile(
-                state["profile_data"],
-                state.get("target_role"),
-                request_id
-            )
+            if analysis_results:
+                logger.info(f"[INFO] [REQ:{request_id}] Using analysis computed concurrently with profile collection")
+            else:
+                logger.info(f"[INFO] [REQ:{request_id}] Analyzing profile for target role: {state.get('target_role', 'General')}")
+
+                # Get the shared agent for this API key
+                profile_analyzer = get_profile_analyzer(api_key)
+
+                analysis_results = await _with_step_timeout(
+                    profile_analyzer.analyze_profile(
+                        state["profile_data"],
+                        state.get("target_role"),
+                        request_id
+                    ),
+                    "Profile analysis"
+                )
 
             state["analysis_results"] = analysis_results
             state["status"] = "Profile analysis completed"
 
-            step_time = time.time() - step_start
-            if not state.get("step_timings"):
-                state["step_timings"] = {}
-            state["step_timings"]["profile_analysis"] = step_time
+            step_time = timer.record()
 
             logger.info(f"[OK] [REQ:{request_id}] Profile analysis completed in {step_time:.2f}s")
             logger.info(f"[INFO] [REQ:{request_id}] Analysis score: {analysis_results.get('overall_score', 'N/A')}/100")
 
             # Save step progress immediately
-            progress_saved = await storage.save_step_progress(
+            progress_saved = await self._save_progress(
                 optimization_id=request_id,
                 step_name="profile_analysis",
                 step_data={
@@ -256,13 +411,13 @@ class LinkedInOptimizerWorkflow:
                 logger.warning(f"[WARN] [REQ:{request_id}] Failed to save profile_analysis progress to DynamoDB")
 
         except Exception as e:
-            step_time = time.time() - step_start
+            step_time = timer.elapsed
             state["error"] = f"Error in profile analysis: {str(e)}"
             state["status"] = "Failed to analyze profile"
             logger.error(f"[ERROR] [REQ:{request_id}] Profile analysis failed after {step_time:.2f}s: {str(e)}")
 
             # Save failed status to DynamoDB
-            await storage.save_step_progress(
+            await self._save_progress(
                 optimization_id=request_id,
                 step_name="profile_analysis",
                 step_data={
@@ -278,7 +433,7 @@ class LinkedInOptimizerWorkflow:
         """Node for generating content ideas and posts."""
         request_id = state.get("request_id", "unknown")
         api_key = state.get("api_key") or self.api_key
-        step_start = time.time()
+        timer = StepTimer(state, "content_generation")
 
         logger.info(f"[INFO] [REQ:{request_id}] Starting Content Generator Agent...")
 
@@ -294,28 +449,28 @@ class LinkedInOptimizerWorkflow:
 
             logger.info(f"[INFO] [REQ:{request_id}] Generating content based on profile analysis...")
 
-            # Initialize agent with API key
-            content_generator = ContentGeneratorAgent(api_key=api_key)
+            # Get the shared agent for this API key
+            content_generator = get_content_generator(api_key)
 
-            content_results = await content_generator.generate_content(
-                state["profile_data"],
-                state["analysis_results"],
-                request_id
+            content_results = await _with_step_timeout(
+                content_generator.generate_content(
+                    state["profile_data"],
+                    state["analysis_results"],
+                    request_id
+                ),
+                "Content generation"
             )
 
             state["content_results"] = content_results
             state["status"] = "Content generation completed"
 
-            step_time = time.time() - step_start
-            if not state.get("step_timings"):
-                state["step_timings"] = {}
-            state["step_timings"]["content_generation"] = step_time
+            step_time = timer.record()
 
             logger.info(f"[OK] [REQ:{request_id}] Content generation completed in {step_time:.2f}s")
             logger.info(f"[INFO] [REQ:{request_id}] Generated {len(content_results.get('content_ideas', []))} content ideas")
 
             # Save step progress immediately
-            progress_saved = await storage.save_step_progress(
+            progress_saved = await self._save_progress(
                 optimization_id=request_id,
                 step_name="content_generation",
                 step_data={
@@ -332,13 +487,13 @@ class LinkedInOptimizerWorkflow:
                 logger.warning(f"[WARN] [REQ:{request_id}] Failed to save content_generation progress to DynamoDB")
 
         except Exception as e:
-            step_time = time.time() - step_start
+            step_time = timer.elapsed
             state["error"] = f"Error in content generation: {str(e)}"
             state["status"] = "Failed to generate content"
             logger.error(f"[ERROR] [REQ:{request_id}] Content generation failed after {step_time:.2f}s: {str(e)}")
 
             # Save failed status to DynamoDB
-            await storage.save_step_progress(
+            await self._save_progress(
                 optimization_id=request_id,
                 step_name="content_generation",
                 step_data={
@@ -353,7 +508,7 @@ class LinkedInOptimizerWorkflow:
     async def _compile_results_node(self, state: WorkflowState) -> WorkflowState:
         """Node for compiling final results."""
         request_id = state.get("request_id", "unknown")
-        step_start = time.time()
+        timer = StepTimer(state, "results_compilation")
 
         logger.info(f"[INFO] [REQ:{request_id}] Starting results compilation...")
 
@@ -363,27 +518,7 @@ class LinkedInOptimizerWorkflow:
                 error_msg = state["error"]
                 logger.warning(f"[WARN] [REQ:{request_id}] Compiling partial results due to error: {error_msg}")
 
-                # Check if this is a critical error
-                critical_keywords = [
-                    "api key", "authentication", "unauthorized", "invalid_api_key",
-                    "invalid_request_error", "rate_limit", "quota_exceeded",
-                    "insufficient_quota", "billing", "permission denied", "forbidden"
-                ]
-
-                is_critical = any(keyword in error_msg.lower() for keyword in critical_keywords)
-
-                # Provide user-friendly error message for critical errors
-                if is_critical:
-                    if "api key" in error_msg.lower() or "authentication" in error_msg.lower():
-                        user_message = "Invalid or missing OpenAI API key. Please check your API key and try again."
-                    elif "rate_limit" in error_msg.lower() or "quota" in error_msg.lower():
-                        user_message = "API rate limit or quota exceeded. Please try again later or check your OpenAI account."
-                    elif "billing" in error_msg.lower():
-                        user_message = "OpenAI billing issue. Please check your OpenAI account billing status."
-                    else:
-                        user_message = "Authentication or permission error. Please check your OpenAI API key."
-                else:
-                    user_message = error_msg
+                is_critical, user_message = _classify_error(error_msg)
 
                 state["final_results"] = {
                     "success": False,
@@ -396,7 +531,7 @@ class LinkedInOptimizerWorkflow:
                 }
 
                 # Save failed status to DynamoDB with progress at 0%
-                await storage.save_step_progress(
+                await self._save_progress(
                     optimization_id=request_id,
                     step_name="optimization_completed",
                     step_data={
@@ -411,32 +546,30 @@ class LinkedInOptimizerWorkflow:
 
             state["status"] = "Compiling final optimization report..."
 
-            # Aggregate token usage from all steps
-            total_token_usage = {
-                'model': config.OPENAI_MODEL,
-                'prompt_tokens': 0,
-                'completion_tokens': 0,
-                'total_tokens': 0
-            }
+            profile_data = state["profile_data"]
+            analysis = state["analysis_results"]
+            content = state["content_results"]
 
-            for key in ['profile_data', 'analysis_results', 'content_results']:
-                if state.get(key) and state[key].get('token_usage'):
-                    usage = state[key]['token_usage']
-                    total_token_usage['prompt_tokens'] += usage.get('prompt_tokens', 0)
-                    total_token_usage['completion_tokens'] += usage.get('completion_tokens', 0)
-                    total_token_usage['total_tokens'] += usage.get('total_tokens', 0)
+            # Aggregate token usage from all steps
+            token_totals = dict.fromkeys(_TOKEN_USAGE_FIELDS, 0)
+            for result in (profile_data, analysis, content):
+                usage = result.get('token_usage')
+                if usage:
+                    for field in _TOKEN_USAGE_FIELDS:
+                        token_totals[field] += usage.get(field, 0)
+            total_token_usage = {'model': config.OPENAI_MODEL, **token_totals}
 
             # Compile comprehensive results
             final_results = {
                 "success": True,
                 "status": "LinkedIn Profile optimization completed successfully",
-                "profile_data": state["profile_data"],
-                "analysis_results": state["analysis_results"],
-                "content_results": state["content_results"],
+                "profile_data": profile_data,
+                "analysis_results": analysis,
+                "content_results": content,
                 "summary": self._generate_summary(state),
-                "recommendations_count": len(state["analysis_results"].get("next_steps", [])),
-                "content_ideas_count": len(state["content_results"].get("content_ideas", [])),
-                "sample_posts_count": len(state["content_results"].get("sample_posts", [])),
+                "recommendations_count": len(analysis.get("next_steps") or []),
+                "content_ideas_count": len(content.get("content_ideas") or []),
+                "sample_posts_count": len(content.get("sample_posts") or []),
                 "step_timings": state.get("step_timings"),
                 "token_usage": total_token_usage
             }
@@ -444,19 +577,20 @@ class LinkedInOptimizerWorkflow:
             state["final_results"] = final_results
             state["status"] = "Optimization completed successfully"
 
-            step_time = time.time() - step_start
-            if not state.get("step_timings"):
-                state["step_timings"] = {}
-            state["step_timings"]["results_compilation"] = step_time
+            step_time = timer.record()
 
             # Log performance summary
-            timings = state.get("step_timings", {})
+            timings = state["step_timings"]
             total_time = sum(timings.values())
             logger.info(f"[OK] [REQ:{request_id}] Results compilation completed in {step_time:.2f}s")
-            logger.info(f"[COMPLETE] [REQ:{request_id}] WORKFLOW COMPLETE - Total time: {total_time:.2f}s")
-            logger.info(f"[INFO] [REQ:{request_id}] Performance breakdown:")
-            for step, duration in timings.items():
-                logger.info(f"    - {step}: {duration:.2f}s ({(duration/total_time*100):.1f}%)")
+            if logger.isEnabledFor(logging.INFO):
+                percent_scale = 100 / (total_time or 1.0)
+                breakdown = "\n".join(
+                    f"    - {step}: {duration:.2f}s ({duration * percent_scale:.1f}%)"
+                    for step, duration in timings.items()
+                )
+                logger.info("[COMPLETE] [REQ:%s] WORKFLOW COMPLETE - Total time: %.2fs\n[INFO] [REQ:%s] Performance breakdown:\n%s",
+                            request_id, total_time, request_id, breakdown)
 
             # Save results to DynamoDB
             if storage.is_enabled():
@@ -468,7 +602,7 @@ class LinkedInOptimizerWorkflow:
                         'target_role': state.get('target_role'),
                         'processing_time': total_time,
                         'step_timings': timings,
-                        'file_size': len(state.get('pdf_bytes', b'')) if state.get('pdf_bytes') else None
+                        'file_size': state.get('pdf_size') or None
                     }
 
                     # Save results (this will run synchronously in the async context)
@@ -495,7 +629,7 @@ class LinkedInOptimizerWorkflow:
                 final_results['storage_saved'] = False
 
             # Save final completion step progress
-            progress_saved = await storage.save_step_progress(
+            progress_saved = await self._save_progress(
                 optimization_id=request_id,
                 step_name="optimization_completed",
                 step_data={
@@ -511,7 +645,7 @@ class LinkedInOptimizerWorkflow:
                 logger.warning(f"[WARN] [REQ:{request_id}] Failed to save completion progress to DynamoDB")
 
         except Exception as e:
-            step_time = time.time() - step_start
+            step_time = timer.elapsed
             state["error"] = f"Error compiling results: {str(e)}"
             state["status"] = "Failed to compile results"
             state["final_results"] = {
@@ -524,7 +658,7 @@ class LinkedInOptimizerWorkflow:
             logger.error(f"[ERROR] [REQ:{request_id}] Results compilation failed after {step_time:.2f}s: {str(e)}")
 
             # Save failed status to DynamoDB
-            await storage.save_step_progress(
+            await self._save_progress(
                 optimization_id=request_id,
                 step_name="optimization_completed",
                 step_data={
@@ -540,16 +674,18 @@ class LinkedInOptimizerWorkflow:
     def _generate_summary(self, state: WorkflowState) -> Dict[str, Any]:
         """Generate a summary of the optimization results."""
         try:
-            analysis = state.get("analysis_results", {})
-            content = state.get("content_results", {})
-            profile = state.get("profile_data", {})
+            analysis = state.get("analysis_results") or {}
+            content = state.get("content_results") or {}
+            profile = state.get("profile_data") or {}
+            next_steps = analysis.get("next_steps") or []
+            strategy = content.get("content_strategy") or {}
 
             summary = {
                 "profile_completeness": self._calculate_profile_completeness(profile),
                 "optimization_score": analysis.get("overall_score", 0),
-                "key_improvements": analysis.get("next_steps", [])[:3],  # Top 3
-                "content_strategy": content.get("content_strategy", {}).get("content_pillars", [])[:3],  # Top 3
-                "recommended_actions": self._generate_recommended_actions(analysis, content)
+                "key_improvements": next_steps[:3],  # Top 3
+                "content_strategy": (strategy.get("content_pillars") or [])[:3],  # Top 3
+                "recommended_actions": self._generate_recommended_actions(next_steps, strategy)
             }
 
             return summary
@@ -563,42 +699,24 @@ class LinkedInOptimizerWorkflow:
             if not profile_data:
                 return 0
 
-            sections = [
-                "personal_info", "summary", "experience", "education",
-                "skills", "certifications", "recommendations"
-            ]
-
-            completed = 0
-            for section in sections:
-                data = profile_data.get(section)
-                if section == "personal_info":
-                    if data and data.get("name") and data.get("title"):
-                        completed += 1
-                elif section == "summary":
-                    if data and data.strip():
-                        completed += 1
-                else:
-                    if data and len(data) > 0:
-                        completed += 1
-
-            return int((completed / len(sections)) * 100)
+            completed = sum(1 for section, is_complete in _SECTION_RULES if is_complete(profile_data.get(section)))
+            return completed * 100 // len(_SECTION_RULES)
 
         except Exception:
             return 0
 
-    def _generate_recommended_actions(self, analysis: Dict[str, Any], content: Dict[str, Any]) -> list:
-        """Generate top recommended actions for the user."""
+    def _generate_recommended_actions(self, next_steps: list, strategy: Dict[str, Any]) -> list:
+        """Generate top recommended actions for the user from the analysis next steps and content strategy."""
         actions = []
 
         try:
             # Add top analysis recommendations
-            next_steps = analysis.get("next_steps", [])
             actions.extend(next_steps[:2])
 
             # Add content strategy recommendation
-            strategy = content.get("content_strategy", {})
-            if strategy.get("posting_frequency"):
-                actions.append(f"Start posting {strategy.get('posting_frequency')} to build your LinkedIn presence")
+            posting_frequency = strategy.get("posting_frequency")
+            if posting_frequency:
+                actions.append(f"Start posting {posting_frequency} to build your LinkedIn presence")
 
             return actions[:5]  # Return top 5 actions
 
@@ -624,15 +742,23 @@ class LinkedInOptimizerWorkflow:
             Dict[str, Any]: Complete optimization results
         """
         req_id = request_id or "unknown"
-        workflow_start = time.time()
+        workflow_start = time.perf_counter()
 
         logger.info(f"[INFO] [REQ:{req_id}] Initializing LinkedIn Profile Optimization Workflow...")
 
         try:
+            if pdf_bytes:
+                pdf_size = len(pdf_bytes)
+            elif pdf_path:
+                pdf_size = os.path.getsize(pdf_path)
+            else:
+                pdf_size = 0
+
             # Initialize state
             initial_state = WorkflowState(
                 pdf_path=pdf_path,
                 pdf_bytes=pdf_bytes,
+                pdf_size=pdf_size,
                 target_role=target_role,
                 profile_data=None,
                 analysis_results=None,
@@ -646,30 +772,29 @@ class LinkedInOptimizerWorkflow:
             )
 
             # Save initial progress tracking
-            progress_saved = await storage.save_step_progress(
+            progress_saved = await self._save_progress(
                 optimization_id=req_id,
                 step_name="optimization_started",
                 step_data={
                     'target_role': target_role,
                     'has_pdf_path': bool(pdf_path),
                     'has_pdf_bytes': bool(pdf_bytes),
-                    'pdf_size': len(pdf_bytes) if pdf_bytes else 0
+                    'pdf_size': pdf_size
                 },
                 status="processing"
             )
 
-            if progress_saved:
-                logger.info(f"[OK] [REQ:{req_id}] Initial progress saved to DynamoDB")
-            else:
+            if not progress_saved:
                 logger.error(f"[ERROR] [REQ:{req_id}] Failed to save initial progress to DynamoDB")
+            elif self._storage_enabled:
+                logger.info(f"[OK] [REQ:{req_id}] Initial progress saved to DynamoDB")
 
             logger.info(f"[INFO] [REQ:{req_id}] Starting LangGraph workflow execution...")
 
             # Run the workflow
-            config = {"configurable": {"thread_id": f"linkedin_optimizer_{req_id}"}}
-            result = await self.workflow.ainvoke(initial_state, config=config)
+            result = await self.workflow.ainvoke(initial_state)
 
-            workflow_time = time.time() - workflow_start
+            workflow_time = time.perf_counter() - workflow_start
             logger.info(f"[OK] [REQ:{req_id}] LangGraph workflow completed in {workflow_time:.2f}s")
 
             final_results = result.get("final_results", {
@@ -686,7 +811,7 @@ class LinkedInOptimizerWorkflow:
             return final_results
 
         except Exception as e:
-            workflow_time = time.time() - workflow_start
+            workflow_time = time.perf_counter() - workflow_start
             logger.error(f"[CRITICAL] [REQ:{req_id}] Critical workflow failure after {workflow_time:.2f}s: {str(e)}")
             return {
                 "success": False,
@@ -705,7 +830,6 @@ class LinkedInOptimizerWorkflow:
             Dict[str, Any]: Current workflow status
         """
         try:
-            config = {"configurable": {"thread_id": thread_id}}
             # This would require implementing state persistence
             # For now, return a basic status
             return {